@@ -7,12 +7,20 @@ Run the API server first: python -m src.api.server
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
 
 API_BASE = "http://localhost:8000/api/v1/privacy"
 
 
+def create_session():
+    """Create an HTTP session that keeps connections to the API alive between calls"""
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+    return session
+
+
 def print_response(title, response):
     """Pretty print API response"""
     print(f"\n{'='*60}")
@@ -21,7 +29,7 @@ def print_response(title, response):
     print(json.dumps(response, indent=2))
 
 
-def demo_mode_selection():
+def demo_mode_selection(session):
     """Demonstrate mode selection with different risk levels"""
     print("\n" + "="*60)
     print("DEMO: Mode Selection")
@@ -29,7 +37,7 @@ def demo_mode_selection():
     
     # Low risk trade
     print("\n1. Low Risk Trade (5 SOL, low sniper activity)")
-    response = requests.post(
+    response = session.post(
         f"{API_BASE}/select-mode",
         json={
             "user_preference": None,
@@ -44,7 +52,7 @@ def demo_mode_selection():
     
     # Medium risk trade
     print("\n2. Medium Risk Trade (30 SOL, moderate sniper activity)")
-    response = requests.post(
+    response = session.post(
         f"{API_BASE}/select-mode",
         json={
             "user_preference": None,
@@ -59,7 +67,7 @@ def demo_mode_selection():
     
     # High risk trade
     print("\n3. High Risk Trade (80 SOL, high sniper activity)")
-    response = requests.post(
+    response = session.post(
         f"{API_BASE}/select-mode",
         json={
             "user_preference": None,
@@ -71,14 +79,14 @@ def demo_mode_selection():
     print_response("Response:", response.json())
 
 
-def demo_user_preference():
+def demo_user_preference(session):
     """Demonstrate user preference override"""
     print("\n" + "="*60)
     print("DEMO: User Preference")
     print("="*60)
     
     print("\nUser explicitly requests Max Ghost mode")
-    response = requests.post(
+    response = session.post(
         f"{API_BASE}/select-mode",
         json={
             "user_preference": "max_ghost",
@@ -89,7 +97,7 @@ def demo_user_preference():
     print_response("Response:", response.json())
 
 
-def demo_dynamic_adjustment():
+def demo_dynamic_adjustment(session):
     """Demonstrate dynamic privacy adjustment"""
     print("\n" + "="*60)
     print("DEMO: Dynamic Adjustment")
@@ -97,7 +105,7 @@ def demo_dynamic_adjustment():
     
     # Start with normal mode
     print("\n1. Initial selection: Normal mode")
-    response = requests.post(
+    response = session.post(
         f"{API_BASE}/select-mode",
         json={
             "risk_level": 0.2,
@@ -110,14 +118,14 @@ def demo_dynamic_adjustment():
     
     # Check current config
     print("\n2. Current configuration:")
-    response = requests.get(f"{API_BASE}/current-config")
+    response = session.get(f"{API_BASE}/current-config")
     print_response("Response:", response.json())
     
     time.sleep(1)
     
     # Adjust due to increased risk
     print("\n3. Adjusting due to increased risk (sniper activity detected)")
-    response = requests.post(
+    response = session.post(
         f"{API_BASE}/adjust",
         json={
             "risk_level": 0.8,
@@ -127,13 +135,13 @@ def demo_dynamic_adjustment():
     print_response("Response:", response.json())
 
 
-def demo_available_modes():
+def demo_available_modes(session):
     """List available privacy modes"""
     print("\n" + "="*60)
     print("DEMO: Available Modes")
     print("="*60)
     
-    response = requests.get(f"{API_BASE}/modes")
+    response = session.get(f"{API_BASE}/modes")
     print_response("Response:", response.json())
 
 
@@ -147,24 +155,26 @@ def main():
     print("\nOr:")
     print("  uvicorn src.api.server:app --host 0.0.0.0 --port 8000")
     
-    try:
-        # Check if server is running
-        response = requests.get("http://localhost:8000/health", timeout=2)
-        if response.status_code != 200:
-            print("\n❌ Server is not responding correctly")
+    # One session for the whole demo, so every call reuses a pooled connection
+    with create_session() as session:
+        try:
+            # Check if server is running
+            response = session.get("http://localhost:8000/health", timeout=2)
+            if response.status_code != 200:
+                print("\n❌ Server is not responding correctly")
+                return
+        except requests.exceptions.RequestException:
+            print("\n❌ Cannot connect to API server at http://localhost:8000")
+            print("   Please start the server first!")
             return
-    except requests.exceptions.RequestException:
-        print("\n❌ Cannot connect to API server at http://localhost:8000")
-        print("   Please start the server first!")
-        return
-    
-    print("\n✅ Server is running!")
-    
-    # Run demos
-    demo_available_modes()
-    demo_mode_selection()
-    demo_user_preference()
-    demo_dynamic_adjustment()
+        
+        print("\n✅ Server is running!")
+        
+        # Run demos
+        demo_available_modes(session)
+        demo_mode_selection(session)
+        demo_user_preference(session)
+        demo_dynamic_adjustment(session)
     
     print("\n" + "="*60)
     print("Demo complete!")
@@ -32,6 +32,9 @@ setup(
     python_requires=">=3.10",
     install_requires=requirements,
     extras_require={
+        "jit": [
+            "numba>=0.58.0",
+        ],
         "dev": [
             "pytest>=7.4.3",
             "pytest-asyncio>=0.21.1",
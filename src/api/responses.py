@@ -0,0 +1,21 @@
+"""
+Response classes for the Privacy Gradient Engine API
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response serialized with orjson
+    
+    Defined locally because fastapi.responses.ORJSONResponse is deprecated
+    in recent FastAPI releases.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        """Serialize content to JSON bytes"""
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
@@ -4,15 +4,21 @@ API Routes for Privacy Gradient Engine
 REST API endpoints for the Privacy Gradient Engine.
 """
 
+import asyncio
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Sequence
 from ..pge.orchestrator import PrivacyGradientEngine
-from ..pge.privacy_level import PrivacyMode
+from ..pge.mode_selector import SelectionContext
+from ..pge.privacy_level import PrivacyMode, PrivacyLevel, get_privacy_level
 from ..config.settings import Settings
+from ..utils.batching import BatchQueue
 
 router = APIRouter(prefix="/api/v1/privacy", tags=["privacy"])
 
+# Handlers that only do CPU work are plain `def`: FastAPI runs them in its
+# threadpool so they do not hold up the event loop.
+
 # Global engine instance (in production, use dependency injection)
 engine = PrivacyGradientEngine(default_mode=Settings.get_default_mode())
 
@@ -36,45 +42,146 @@ class PrivacyConfigResponse(BaseModel):
     rotation_frequency: int
 
 
-@router.post("/select-mode", response_model=PrivacyConfigResponse)
+def _build_response(level: PrivacyLevel) -> PrivacyConfigResponse:
+    """Build the API response for a privacy level"""
+    # Levels are validated on construction, so skip re-validating them here
+    return PrivacyConfigResponse.model_construct(
+        mode=level.mode.value,
+        burner_count=level.burner_count,
+        timing_jitter_ms=level.timing_jitter_ms,
+        order_slicing=level.order_slicing,
+        fragmentation_level=level.fragmentation_level,
+        use_mev_protection=level.use_mev_protection,
+        rotation_frequency=level.rotation_frequency,
+    )
+
+
+# Privacy config endpoints return server-built responses, so they use
+# response_model=None to skip FastAPI's output validation; the schemas are
+# still documented in OpenAPI through `responses`.
+_CONFIG_RESPONSE: Dict[int, Dict[str, Any]] = {200: {"model": PrivacyConfigResponse}}
+_CONFIG_LIST_RESPONSE: Dict[int, Dict[str, Any]] = {200: {"model": List[PrivacyConfigResponse]}}
+
+# Responses for the predefined levels, built once at import
+_RESP_CACHE: Dict[PrivacyMode, PrivacyConfigResponse] = {
+    mode: _build_response(get_privacy_level(mode)) for mode in PrivacyMode
+}
+
+
+def _level_response(level: PrivacyLevel) -> PrivacyConfigResponse:
+    """
+    Get the API response for a privacy level
+    
+    Predefined levels are served from _RESP_CACHE; levels built at runtime
+    (e.g. from an Arcium plan) get a fresh response.
+    """
+    if level is get_privacy_level(level.mode):
+        return _RESP_CACHE[level.mode]
+    return _build_response(level)
+
+
+# Static /modes payload, built once at import
+_MODES_PAYLOAD: Dict[str, Any] = {
+    "modes": [mode.value for mode in PrivacyMode],
+    "descriptions": {
+        "normal": "Basic unlinkability - single burner, minimal jitter",
+        "stealth": "Timing unpredictability - multiple burners, moderate jitter",
+        "max_ghost": "Full camouflage - many burners, maximum jitter and slicing"
+    }
+}
+
+
+class BatchModeSelectionRequest(BaseModel):
+    """Request model for batched mode selection"""
+    requests: List[ModeSelectionRequest] = Field(..., description="Mode selection requests to evaluate together")
+
+
+def _selection_context(request: ModeSelectionRequest) -> SelectionContext:
+    """
+    Parse one request's inputs for _select_levels
+    
+    curve_conditions is a free-form dict, so sniper_activity is converted
+    here, per request: an invalid value fails this request only instead of
+    the whole vectorized batch it would be selected in.
+    
+    Raises:
+        ValueError, TypeError: If sniper_activity is not a number
+    """
+    return SelectionContext.from_inputs(
+        request.user_preference,
+        request.risk_level,
+        request.transaction_amount,
+        request.curve_conditions,
+    )
+
+
+def _select_levels(
+    contexts: Sequence[SelectionContext],
+    update_state: bool = False
+) -> List[PrivacyLevel]:
+    """Select privacy levels for a batch of requests in one vectorized pass"""
+    return engine.select_modes_for_contexts(contexts, update_state)
+
+
+async def _select_levels_batch(contexts: List[SelectionContext]) -> List[PrivacyLevel]:
+    """
+    BatchQueue handler for /select-mode
+    
+    The last level of each batch becomes the engine's current level, the
+    same result as selecting the requests one by one in arrival order.
+    The selection is CPU work, so it runs in a worker thread like the
+    other CPU-only handlers; the queue handles one batch at a time, so
+    batches still update the engine in order.
+    """
+    return await asyncio.to_thread(_select_levels, contexts, True)
+
+
+# Concurrent /select-mode requests are evaluated together (see BatchQueue)
+select_mode_batcher = BatchQueue(_select_levels_batch, Settings.BATCH_MAX, Settings.BATCH_WAIT_MS)
+
+
+@router.post("/select-mode", response_model=None, responses=_CONFIG_RESPONSE)
 async def select_mode(request: ModeSelectionRequest):
     """
     Select privacy mode based on parameters
     
+    Concurrent requests are micro-batched (see select_mode_batcher); each
+    request's inputs are parsed before it joins a batch.
     Returns privacy configuration for the selected mode.
     """
     try:
-        level = engine.select_mode(
-            user_preference=request.user_preference,
-            risk_level=request.risk_level,
-            transaction_amount=request.transaction_amount,
-            curve_conditions=request.curve_conditions
-        )
-        
-        return PrivacyConfigResponse(
-            mode=level.mode.value,
-            burner_count=level.burner_count,
-            timing_jitter_ms=level.timing_jitter_ms,
-            order_slicing=level.order_slicing,
-            fragmentation_level=level.fragmentation_level,
-            use_mev_protection=level.use_mev_protection,
-            rotation_frequency=level.rotation_frequency,
-        )
+        level = await select_mode_batcher.submit(_selection_context(request))
+        return _level_response(level)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/current-config", response_model=PrivacyConfigResponse)
+@router.post("/select-mode/batch", response_model=None, responses=_CONFIG_LIST_RESPONSE)
+def select_mode_batch(request: BatchModeSelectionRequest):
+    """
+    Select privacy modes for several requests in one call
+    
+    Returns one privacy configuration per request, in request order.
+    Does not change the engine's current configuration.
+    """
+    try:
+        levels = _select_levels([_selection_context(r) for r in request.requests])
+        return [_level_response(level) for level in levels]
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/current-config", response_model=None, responses=_CONFIG_RESPONSE)
 async def get_current_config():
     """Get current privacy configuration"""
-    config = engine.get_privacy_config()
-    if not config:
+    level = engine.get_current_level()
+    if level is None:
         raise HTTPException(status_code=404, detail="No privacy mode selected yet")
-    return PrivacyConfigResponse(**config)
+    return _level_response(level)
 
 
-@router.post("/adjust", response_model=PrivacyConfigResponse)
-async def adjust_privacy(context: Dict[str, Any]):
+@router.post("/adjust", response_model=None, responses=_CONFIG_RESPONSE)
+def adjust_privacy(context: Dict[str, Any]):
     """
     Adjust privacy level based on context
     
@@ -85,15 +192,7 @@ async def adjust_privacy(context: Dict[str, Any]):
     """
     try:
         level = engine.adjust_privacy_level(context)
-        return PrivacyConfigResponse(
-            mode=level.mode.value,
-            burner_count=level.burner_count,
-            timing_jitter_ms=level.timing_jitter_ms,
-            order_slicing=level.order_slicing,
-            fragmentation_level=level.fragmentation_level,
-            use_mev_protection=level.use_mev_protection,
-            rotation_frequency=level.rotation_frequency,
-        )
+        return _level_response(level)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -108,12 +207,5 @@ async def reset_engine():
 @router.get("/modes")
 async def get_available_modes():
     """Get list of available privacy modes"""
-    return {
-        "modes": [mode.value for mode in PrivacyMode],
-        "descriptions": {
-            "normal": "Basic unlinkability - single burner, minimal jitter",
-            "stealth": "Timing unpredictability - multiple burners, moderate jitter",
-            "max_ghost": "Full camouflage - many burners, maximum jitter and slicing"
-        }
-    }
+    return _MODES_PAYLOAD
 
@@ -2,18 +2,36 @@
 FastAPI server for Privacy Gradient Engine
 """
 
+import sys
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from .routes import router
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+from .responses import ORJSONResponse
+from .routes import router, engine, select_mode_batcher
 from ..config.settings import Settings
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start and stop background workers with the app"""
+    select_mode_batcher.start()
+    yield
+    await select_mode_batcher.stop()
+    await engine.aclose()
+
+
 app = FastAPI(
     title="Evalys Privacy Gradient Engine",
     description="Privacy mode orchestration for Evalys ecosystem",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # CORS middleware
@@ -25,6 +43,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Precomputed health check response
+_HEALTH = Response(b'{"status":"healthy"}', media_type="application/json")
+
+
+async def health(request: Request) -> Response:
+    """Health check endpoint"""
+    return _HEALTH
+
+
+# Health check is a raw Starlette route, matched first and bypassing FastAPI's
+# request parsing and response serialization (not listed in OpenAPI)
+app.router.routes.insert(0, Route("/health", endpoint=health, methods=["GET"]))
+
 # Include routes
 app.include_router(router)
 
@@ -39,19 +70,17 @@ async def root():
     }
 
 
-@app.get("/health")
-async def health():
-    """Health check endpoint"""
-    return {"status": "healthy"}
-
-
 if __name__ == "__main__":
     import uvicorn
-    logger.info(f"Starting server on {Settings.API_HOST}:{Settings.API_PORT}")
+    logger.info("Starting server on %s:%s", Settings.API_HOST, Settings.API_PORT)
+    # Import string (not the app object) is required for workers > 1 and reload
     uvicorn.run(
-        app,
+        "src.api.server:app",
         host=Settings.API_HOST,
         port=Settings.API_PORT,
-        reload=Settings.API_DEBUG
+        reload=Settings.API_DEBUG,
+        workers=Settings.API_WORKERS,
+        loop="auto" if sys.platform == "win32" else "uvloop",  # uvloop is not available on Windows
+        http="httptools",
     )
 
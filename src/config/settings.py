@@ -4,7 +4,7 @@ Configuration settings
 
 import os
 from typing import Optional
-from ..pge.privacy_level import PrivacyMode
+from ..pge.privacy_level import PrivacyMode, _MODE_BY_VALUE
 
 
 class Settings:
@@ -20,13 +20,15 @@ class Settings:
     API_HOST: str = os.getenv("API_HOST", "0.0.0.0")
     API_PORT: int = int(os.getenv("API_PORT", "8000"))
     API_DEBUG: bool = os.getenv("API_DEBUG", "false").lower() == "true"
+    API_WORKERS: int = int(os.getenv("API_WORKERS", "1"))
+    
+    # /select-mode micro-batching
+    BATCH_MAX: int = int(os.getenv("BATCH_MAX", "64"))
+    BATCH_WAIT_MS: float = float(os.getenv("BATCH_WAIT_MS", "2"))
     
     @classmethod
     def get_default_mode(cls) -> PrivacyMode:
         """Get default privacy mode from env or default"""
         mode_str = os.getenv("DEFAULT_PRIVACY_MODE", cls.DEFAULT_PRIVACY_MODE.value)
-        try:
-            return PrivacyMode(mode_str.lower())
-        except ValueError:
-            return cls.DEFAULT_PRIVACY_MODE
+        return _MODE_BY_VALUE.get(mode_str.lower(), cls.DEFAULT_PRIVACY_MODE)
 
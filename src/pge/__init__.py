@@ -9,13 +9,14 @@ in the Evalys ecosystem. It manages three privacy levels:
 """
 
 from .privacy_level import PrivacyLevel, PrivacyMode
-from .mode_selector import ModeSelector
+from .mode_selector import ModeSelector, SelectionContext
 from .orchestrator import PrivacyGradientEngine
 
 __all__ = [
     "PrivacyLevel",
     "PrivacyMode",
     "ModeSelector",
+    "SelectionContext",
     "PrivacyGradientEngine",
 ]
 
@@ -0,0 +1,79 @@
+"""
+Mode Selection Kernels
+
+Numeric core of ModeSelector as plain functions over integer mode codes,
+compiled with Numba when it is installed (pip install evalys-privacy-engine[jit]).
+Without Numba the same functions run as regular Python.
+
+Missing numeric inputs are passed as NaN: comparisons against NaN are
+always False, so a missing input never triggers a rule.
+
+Mode codes (see privacy_level._INT_TO_MODE):
+- 0: NORMAL
+- 1: STEALTH
+- 2: MAX_GHOST
+- 3: CONFIDENTIAL
+- -1: no (valid) user preference
+"""
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback decorator: returns the function unchanged"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def _select(
+    pref_code: int,
+    risk: float,
+    amt: float,
+    sniper: float,
+    default_code: int
+) -> int:
+    """
+    Threshold cascade behind ModeSelector.select_mode.
+    
+    Branchless: each rule is a (decides, code) pair computed with boolean
+    arithmetic, and the first deciding rule in priority order wins.
+    
+    Returns:
+        Mode code of the selected mode
+    """
+    # Risk level thresholds (any risk above 0.3 decides, including NORMAL)
+    risk_hit = risk > 0.3
+    risk_code = (risk > 0.5) + (risk > 0.8)
+    
+    # Curve conditions (sniper activity)
+    sniper_hit = sniper > 0.4
+    sniper_code = 1 + (sniper > 0.7)
+    
+    # Transaction amount
+    amt_hit = amt > 10.0
+    amt_code = 1 + (amt > 50.0)
+    
+    # Lowest priority first, so each higher-priority rule overrides
+    code = amt_hit * amt_code + (not amt_hit) * default_code
+    code = sniper_hit * sniper_code + (not sniper_hit) * code
+    code = risk_hit * risk_code + (not risk_hit) * code
+    
+    # User preference, with risk-based safety override
+    pref_hit = pref_code >= 0
+    pref_result = pref_code + ((risk > 0.7) & (pref_code <= 1))
+    return pref_hit * pref_result + (not pref_hit) * code
+
+
+@njit(cache=True)
+def _adjust(mode_code: int, risk: float, sniper: float) -> int:
+    """
+    Escalation rules behind ModeSelector.adjust_mode_for_context.
+    
+    Returns:
+        Mode code of the adjusted mode
+    """
+    escalate_normal = (mode_code == 0) & ((risk > 0.7) | (sniper > 0.6))
+    escalate_stealth = (mode_code == 1) & ((risk > 0.9) | (sniper > 0.8))
+    return mode_code + (escalate_normal | escalate_stealth)
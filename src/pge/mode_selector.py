@@ -11,8 +11,138 @@ This module implements rule-based mode selection using risk thresholds:
 See docs/risk-model.md for detailed risk scoring formula.
 """
 
-from typing import Optional
-from .privacy_level import PrivacyMode, PrivacyLevel, get_privacy_level
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+import numpy as np
+from .privacy_level import (
+    PrivacyMode,
+    PrivacyLevel,
+    get_privacy_level,
+    _INT_TO_MODE,
+    _MODE_TO_INT,
+)
+from ._jit import _select, _adjust
+
+# Preference string -> mode code, built once instead of PrivacyMode(...) per call
+_PREF_CODES = {mode.value: code for code, mode in enumerate(_INT_TO_MODE)}
+
+_NAN = float("nan")
+
+# Bucket edges for select_modes_vec: every threshold _select compares each
+# input against (0.7 is the risk level that escalates a user preference).
+# np.searchsorted(edges, x) counts the edges strictly below x, so bucket k
+# holds values in (edges[k-1], edges[k]], matching the strict ">" rules.
+_RISK_EDGES = np.array([0.3, 0.5, 0.7, 0.8])
+_SNIPER_EDGES = np.array([0.4, 0.7])
+_AMOUNT_EDGES = np.array([10.0, 50.0])
+
+
+def _build_table() -> np.ndarray:
+    """
+    Precompute _select over every combination of input buckets.
+    
+    Returns:
+        int8 array indexed [default_code, pref_code + 1, risk_bucket,
+        sniper_bucket, amount_bucket]; risk bucket 0 is a missing risk
+        level, the others are shifted up by one
+    """
+    # One representative per bucket: the bucket's upper edge, or a value
+    # past the last edge. Missing sniper activity and amount behave like
+    # their bucket 0, so only risk needs a NaN bucket of its own.
+    def representatives(edges):
+        return [float(edge) for edge in edges] + [float(edges[-1]) + 1.0]
+    
+    risks = [_NAN] + representatives(_RISK_EDGES)
+    snipers = representatives(_SNIPER_EDGES)
+    amounts = representatives(_AMOUNT_EDGES)
+    
+    # Evaluate the plain Python kernel, so importing does not trigger a JIT compile
+    select = getattr(_select, "py_func", _select)
+    table = np.empty(
+        (len(_INT_TO_MODE), len(_INT_TO_MODE) + 1, len(risks), len(snipers), len(amounts)),
+        dtype=np.int8
+    )
+    for index in np.ndindex(table.shape):
+        default_code, pref, r, s, a = index
+        table[index] = select(pref - 1, risks[r], amounts[a], snipers[s], default_code)
+    return table
+
+
+_TABLE = _build_table()
+
+
+def _parse_inputs(
+    user_preference: Optional[str],
+    risk_level: Optional[float],
+    transaction_amount: Optional[float],
+    curve_conditions: Optional[dict]
+) -> Tuple[int, float, float, float]:
+    """
+    Convert select_mode style arguments to _select kernel inputs.
+    
+    The single place that handles missing inputs and preference strings,
+    shared by ModeSelector.select_mode and SelectionContext.
+    
+    Returns:
+        (pref_code, risk, amount, sniper); missing numbers are NaN and a
+        missing or invalid preference is -1
+    """
+    # Each input is checked against None exactly once; 0.0 is a real value
+    sniper = None if curve_conditions is None else curve_conditions.get("sniper_activity")
+    return (
+        # An invalid preference (-1) falls through to auto-selection
+        -1 if user_preference is None else _PREF_CODES.get(user_preference.lower(), -1),
+        _NAN if risk_level is None else float(risk_level),
+        _NAN if transaction_amount is None else float(transaction_amount),
+        _NAN if sniper is None else float(sniper),
+    )
+
+
+@dataclass(slots=True)
+class SelectionContext:
+    """
+    Pre-parsed inputs for mode selection.
+    
+    Numeric inputs that were not provided are NaN. Every threshold
+    comparison against NaN is False, so a missing input never triggers a
+    rule and needs no separate "is provided" check.
+    
+    Attributes:
+        risk: Risk level (0.0 to 1.0)
+        sniper: Curve sniper activity (0.0 to 1.0)
+        amount: Transaction amount in SOL
+        pref_code: Mode code of the user preference (-1 if none or invalid)
+    """
+    risk: float = _NAN
+    sniper: float = _NAN
+    amount: float = _NAN
+    pref_code: int = -1
+    
+    @classmethod
+    def from_inputs(
+        cls,
+        user_preference: Optional[str] = None,
+        risk_level: Optional[float] = None,
+        transaction_amount: Optional[float] = None,
+        curve_conditions: Optional[dict] = None
+    ) -> "SelectionContext":
+        """
+        Build a context from ModeSelector.select_mode style arguments.
+        
+        Args:
+            user_preference: User's preferred mode ("normal", "stealth", "max_ghost")
+            risk_level: Risk level (0.0 to 1.0)
+            transaction_amount: Transaction amount in SOL
+            curve_conditions: Dictionary with curve conditions:
+                - sniper_activity: float (0.0 to 1.0)
+        
+        Returns:
+            SelectionContext with missing values set to NaN
+        """
+        pref_code, risk, amount, sniper = _parse_inputs(
+            user_preference, risk_level, transaction_amount, curve_conditions
+        )
+        return cls(risk=risk, sniper=sniper, amount=amount, pref_code=pref_code)
 
 
 class ModeSelector:
@@ -24,6 +154,9 @@ class ModeSelector:
     Attributes:
         default_mode: Default privacy mode (PrivacyMode.NORMAL)
     
+    Decisions are computed on integer mode codes (see _jit); PrivacyMode
+    values are only decoded on return.
+    
     Invariants:
         - Always returns a valid PrivacyMode
         - Increasing risk_level never decreases privacy mode (monotonicity)
@@ -38,6 +171,15 @@ class ModeSelector:
         """
         self.default_mode = PrivacyMode.NORMAL
     
+    @property
+    def default_mode(self) -> PrivacyMode:
+        """Default privacy mode, returned when no rule applies"""
+        return _INT_TO_MODE[self._default_code]
+    
+    @default_mode.setter
+    def default_mode(self, mode: PrivacyMode) -> None:
+        self._default_code = _MODE_TO_INT[mode]
+    
     def select_mode(
         self,
         user_preference: Optional[str] = None,
@@ -76,49 +218,108 @@ class ModeSelector:
             >>> selector.select_mode(risk_level=0.9)
             PrivacyMode.MAX_GHOST
         """
-        # If user explicitly prefers a mode, use it (with risk override)
-        if user_preference:
-            try:
-                preferred_mode = PrivacyMode(user_preference.lower())
-                
-                # Override to higher privacy if risk is high
-                if risk_level and risk_level > 0.7:
-                    if preferred_mode == PrivacyMode.NORMAL:
-                        return PrivacyMode.STEALTH
-                    elif preferred_mode == PrivacyMode.STEALTH:
-                        return PrivacyMode.MAX_GHOST
-                
-                return preferred_mode
-            except ValueError:
-                # Invalid preference, fall through to auto-selection
-                pass
-        
-        # Auto-select based on risk and conditions
-        if risk_level is not None:
-            if risk_level > 0.8:
-                return PrivacyMode.MAX_GHOST
-            elif risk_level > 0.5:
-                return PrivacyMode.STEALTH
-            elif risk_level > 0.3:
-                return PrivacyMode.NORMAL
-        
-        # Check curve conditions
-        if curve_conditions:
-            sniper_activity = curve_conditions.get("sniper_activity", 0.0)
-            if sniper_activity > 0.7:
-                return PrivacyMode.MAX_GHOST
-            elif sniper_activity > 0.4:
-                return PrivacyMode.STEALTH
-        
-        # Check transaction amount
-        if transaction_amount:
-            if transaction_amount > 10.0:  # Large transaction
-                return PrivacyMode.STEALTH
-            elif transaction_amount > 50.0:  # Very large transaction
-                return PrivacyMode.MAX_GHOST
-        
-        # Default to normal
-        return self.default_mode
+        code = _select(
+            *_parse_inputs(user_preference, risk_level, transaction_amount, curve_conditions),
+            self._default_code
+        )
+        return _INT_TO_MODE[code]
+    
+    def select_mode_for_context(self, context: SelectionContext) -> PrivacyMode:
+        """
+        Select privacy mode from pre-parsed inputs.
+        
+        Same rules as select_mode, without re-reading optional arguments
+        and dictionaries on every call.
+        
+        Args:
+            context: Selection inputs (see SelectionContext)
+        
+        Returns:
+            Selected PrivacyMode
+        
+        Side effects: None (pure function)
+        """
+        code = _select(
+            context.pref_code,
+            context.risk,
+            context.amount,
+            context.sniper,
+            self._default_code
+        )
+        return _INT_TO_MODE[code]
+    
+    def select_modes_vec(
+        self,
+        user_prefs: Sequence[Optional[str]],
+        risks: Sequence[Optional[float]],
+        amounts: Sequence[Optional[float]],
+        sniper: Sequence[Optional[float]]
+    ) -> np.ndarray:
+        """
+        Vectorized select_mode for a batch of requests.
+        
+        Applies the same rules as select_mode to every element at once,
+        as a lookup in a table precomputed from them (see _build_table).
+        Missing numeric inputs may be given as None or NaN.
+        
+        Args:
+            user_prefs: User's preferred mode per request (or None)
+            risks: Risk level per request (0.0 to 1.0)
+            amounts: Transaction amount in SOL per request
+            sniper: Curve sniper activity per request (0.0 to 1.0)
+        
+        Returns:
+            Integer array of mode codes, one per request
+            (decode with _INT_TO_MODE)
+        
+        Side effects: None (pure function)
+        """
+        prefs = np.fromiter(
+            (_PREF_CODES.get(p.lower(), -1) if p else -1 for p in user_prefs),
+            dtype=np.int64,
+            count=len(user_prefs)
+        )
+        return self._lookup_vec(
+            prefs,
+            np.asarray(risks, dtype=float),
+            np.asarray(amounts, dtype=float),
+            np.asarray(sniper, dtype=float),
+        )
+    
+    def select_modes_for_contexts(self, contexts: Sequence[SelectionContext]) -> np.ndarray:
+        """
+        Vectorized select_mode_for_context for a batch of requests.
+        
+        Args:
+            contexts: Pre-parsed selection inputs per request
+        
+        Returns:
+            Integer array of mode codes, one per request
+            (decode with _INT_TO_MODE)
+        
+        Side effects: None (pure function)
+        """
+        count = len(contexts)
+        return self._lookup_vec(
+            np.fromiter((c.pref_code for c in contexts), dtype=np.int64, count=count),
+            np.fromiter((c.risk for c in contexts), dtype=float, count=count),
+            np.fromiter((c.amount for c in contexts), dtype=float, count=count),
+            np.fromiter((c.sniper for c in contexts), dtype=float, count=count),
+        )
+    
+    def _lookup_vec(
+        self,
+        prefs: np.ndarray,
+        risks: np.ndarray,
+        amounts: np.ndarray,
+        sniper: np.ndarray
+    ) -> np.ndarray:
+        """Look the mode codes for parsed input arrays up in _TABLE"""
+        # Quantize each input to its bucket and look the decision up in _TABLE
+        risk_b = np.where(np.isnan(risks), 0, np.searchsorted(_RISK_EDGES, risks) + 1)
+        sniper_b = np.where(np.isnan(sniper), 0, np.searchsorted(_SNIPER_EDGES, sniper))
+        amount_b = np.where(np.isnan(amounts), 0, np.searchsorted(_AMOUNT_EDGES, amounts))
+        return _TABLE[self._default_code][prefs + 1, risk_b, sniper_b, amount_b]
     
     def adjust_mode_for_context(
         self,
@@ -154,17 +355,13 @@ class ModeSelector:
             ... )
             PrivacyMode.STEALTH
         """
-        risk = context.get("risk_level", 0.0)
-        sniper_activity = context.get("sniper_activity", 0.0)
+        # Missing or null indicators are NaN, which never triggers escalation
+        risk = context.get("risk_level")
+        sniper_activity = context.get("sniper_activity")
+        risk = _NAN if risk is None else float(risk)
+        sniper_activity = _NAN if sniper_activity is None else float(sniper_activity)
         
         # Escalate if conditions worsen
-        if current_mode == PrivacyMode.NORMAL:
-            if risk > 0.7 or sniper_activity > 0.6:
-                return PrivacyMode.STEALTH
-        
-        if current_mode == PrivacyMode.STEALTH:
-            if risk > 0.9 or sniper_activity > 0.8:
-                return PrivacyMode.MAX_GHOST
-        
-        return current_mode
+        code = _adjust(_MODE_TO_INT[current_mode], risk, sniper_activity)
+        return _INT_TO_MODE[code]
 
@@ -16,77 +16,315 @@ Architecture:
     PrivacyGradientEngine
     ├── ModeSelector (rule-based mode selection)
     ├── PrivacyLevel (mode configurations)
-    └── Arcium/gMPC bridge clients (optional, lazy-loaded)
+    └── Arcium/gMPC bridge clients (optional, loaded once at import)
 """
 
-from typing import Optional, Dict, Any
-from .privacy_level import PrivacyMode, PrivacyLevel, get_privacy_level
-from .mode_selector import ModeSelector
+import asyncio
+import logging
+import sys
+import threading
+from contextlib import contextmanager
+from functools import partial
+from pathlib import Path
+from types import MappingProxyType, ModuleType
+from typing import Optional, Dict, Any, Callable, Coroutine, Iterator, List, Mapping, NamedTuple, Sequence, Set, Tuple, TypedDict
+from .privacy_level import PrivacyMode, PrivacyLevel, get_privacy_level, _INT_TO_MODE, _MODE_BY_VALUE
+from .mode_selector import ModeSelector, SelectionContext
 from ..utils.logger import get_logger
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 logger = get_logger(__name__)
 
-# Optional Arcium bridge client (lazy import to avoid circular dependencies)
-_arcium_client = None
-_gmcp_client = None
+# Optional bridge services are sibling checkouts of this repository. Their
+# paths are resolved and imported once, at module load; an unavailable bridge
+# is bound as None, so select_mode only tests a module-level name per call.
+_SIBLINGS_DIR = Path(__file__).resolve().parents[3]
+_ARCIUM_BRIDGE_PATH = _SIBLINGS_DIR / "evalys-arcium-bridge-service" / "src"
+# Note: The gMPC bridge service communicates with the unified evalys-arcium-gmpc-mxe MXE
+_GMCP_BRIDGE_PATH = _SIBLINGS_DIR / "evalys-arcium-gMPC" / "src"
 
+# sys.path entries added for the bridges, so each is inserted at most once
+_PATH_INIT_LOCK = threading.Lock()
+_PATHS_ADDED: Set[str] = set()
+
+
+def _add_sys_path(path: Path) -> None:
+    """Prepend a directory to sys.path, unless it was already added"""
+    entry = str(path)
+    with _PATH_INIT_LOCK:
+        if entry not in _PATHS_ADDED:
+            sys.path.insert(0, entry)
+            _PATHS_ADDED.add(entry)
+
+
+def _pop_bridge_modules() -> Dict[str, ModuleType]:
+    """Remove the imported `bridge` package and its submodules from sys.modules"""
+    names = [name for name in sys.modules if name == "bridge" or name.startswith("bridge.")]
+    return {name: sys.modules.pop(name) for name in names}
+
+
+@contextmanager
+def _bridge_package(checkout_dir: Path) -> Iterator[None]:
+    """
+    Make `bridge` resolve to one bridge checkout's package
+    
+    Both bridge services ship a top-level package named `bridge`. Modules
+    already imported from the other checkout are set aside while this one
+    is imported, and put back afterwards, so each loader gets the classes
+    of its own checkout.
+    
+    Args:
+        checkout_dir: Bridge checkout directory (contains the bridge package)
+    """
+    entry = str(checkout_dir)
+    _add_sys_path(checkout_dir)
+    set_aside = _pop_bridge_modules()
+    # Search this checkout first, even if another bridge was prepended later
+    sys.path.insert(0, entry)
+    try:
+        yield
+    finally:
+        sys.path.remove(entry)
+        if set_aside:
+            _pop_bridge_modules()
+            sys.modules.update(set_aside)
+
+
+class ArciumClientInfo(NamedTuple):
+    """Arcium bridge client and model classes"""
+    client: type
+    UserPreferences: type
+    UserHistory: type
+    CurveState: type
+
+
+class GmcpClientInfo(NamedTuple):
+    """gMPC bridge client and model classes"""
+    client: type
+    IntentInput: type
+    MarketSnapshot: type
+    HistoricalStats: type
+
+
+def _load_arcium_bridge() -> Optional[ArciumClientInfo]:
+    """
+    Import the Arcium bridge client (called once at module load)
+    
+    Returns:
+        ArciumClientInfo, or None if the bridge service is not available
+    """
+    if not _ARCIUM_BRIDGE_PATH.exists():
+        return None
+    try:
+        # Imported here to avoid requiring arcium-bridge as a hard dependency
+        with _bridge_package(_ARCIUM_BRIDGE_PATH.parent):
+            from bridge.arcium_client import ArciumBridgeClient
+            from bridge.models import UserPreferences, UserHistory, CurveState
+    except ImportError:
+        logger.warning("Arcium bridge service not available. Confidential mode will use fallback.")
+        return None
+    return ArciumClientInfo(ArciumBridgeClient, UserPreferences, UserHistory, CurveState)
+
+
+def _load_gmcp_bridge() -> Optional[GmcpClientInfo]:
+    """
+    Import the gMPC bridge client (called once at module load)
+    
+    Returns:
+        GmcpClientInfo, or None if the bridge service is not available
+    """
+    if not _GMCP_BRIDGE_PATH.exists():
+        return None
+    try:
+        with _bridge_package(_GMCP_BRIDGE_PATH.parent):
+            from bridge.gmcp_client import GMPCClient
+            from bridge.models import IntentInput, MarketSnapshot, HistoricalStats
+    except ImportError:
+        logger.warning("gMPC bridge service not available. gMPC mode will use fallback.")
+        return None
+    return GmcpClientInfo(GMPCClient, IntentInput, MarketSnapshot, HistoricalStats)
+
+
+_ARCIUM = _load_arcium_bridge()
+_GMCP = _load_gmcp_bridge()
+
+# Plan mode strings -> base PrivacyMode (unknown modes map to MAX_GHOST)
+_ARCIUM_MODE_MAP = {
+    "normal": PrivacyMode.NORMAL,
+    "stealth": PrivacyMode.STEALTH,
+    "max_ghost": PrivacyMode.MAX_GHOST,
+}
+_GMCP_MODE_MAP = {
+    "NORMAL": PrivacyMode.NORMAL,
+    "STEALTH": PrivacyMode.STEALTH,
+    "MAX_GHOST": PrivacyMode.MAX_GHOST,
+}
+
+
+class ArciumInputs(TypedDict, total=False):
+    """Arcium bridge inputs (select_mode's arcium_inputs)"""
+    user_preferences: Dict[str, Any]
+    user_history: Dict[str, Any]
+    curve_state: Dict[str, Any]
+
+
+class GmcpInputs(TypedDict, total=False):
+    """gMPC bridge inputs (select_mode's gmcp_inputs)"""
+    trader_profile_id: str
+    token_mint: str
+    launchpad: str
+    max_size_sol: float
+    risk_level: str
+    privacy_priority: str
+    market_snapshot: Dict[str, Any]
+    historical_stats: Dict[str, Any]
+
+
+# Shared empty read-only mapping: stands in for missing (or None) nested
+# model inputs
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def _build_arcium_request(
+    arcium_inputs: ArciumInputs,
+    arcium_client_info: ArciumClientInfo
+) -> Dict[str, Any]:
+    """
+    Build the Arcium input models for one request
+    
+    Plain function so it can run in a worker thread (asyncio.to_thread).
+    
+    Returns:
+        get_confidential_plan keyword arguments
+    """
+    return {
+        "user_preferences": arcium_client_info.UserPreferences(**(arcium_inputs.get("user_preferences") or _EMPTY)),
+        "user_history": arcium_client_info.UserHistory(**(arcium_inputs.get("user_history") or _EMPTY)),
+        "curve_state": arcium_client_info.CurveState(**(arcium_inputs.get("curve_state") or _EMPTY)),
+    }
+
+
+def _build_intent(gmcp_inputs: GmcpInputs, gmcp_client_info: GmcpClientInfo) -> Any:
+    """
+    Build the gMPC intent input model for one request
+    
+    Plain function so it can run in a worker thread (asyncio.to_thread).
+    
+    Returns:
+        IntentInput for execute_gmpc_strategy
+    """
+    return gmcp_client_info.IntentInput(
+        trader_profile_id=gmcp_inputs.get("trader_profile_id", "anon-default"),
+        token_mint=gmcp_inputs.get("token_mint", ""),
+        launchpad=gmcp_inputs.get("launchpad", "pumpfun"),
+        max_size_sol=gmcp_inputs.get("max_size_sol", 1.0),
+        risk_level=gmcp_inputs.get("risk_level", "normal"),
+        privacy_priority=gmcp_inputs.get("privacy_priority", "max_privacy"),
+        market_snapshot=gmcp_client_info.MarketSnapshot(**(gmcp_inputs.get("market_snapshot") or _EMPTY)),
+        historical_stats=gmcp_client_info.HistoricalStats(**(gmcp_inputs.get("historical_stats") or _EMPTY)),
+    )
+
+
+# Background event loop for bridge calls, shared by all engines (see _bg_loop).
+# Uses uvloop when installed (it comes with uvicorn[standard]; not on Windows).
+# Only this loop is affected: the global event loop policy is left alone.
+_new_event_loop = (
+    uvloop.new_event_loop
+    if uvloop is not None and sys.platform != "win32"
+    else asyncio.new_event_loop
+)
+_BG_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_BG_LOOP_LOCK = threading.Lock()
+
+
+def _bg_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the bridge event loop, starting it on first use
+    
+    The loop runs forever in a daemon thread. Bridge coroutines are submitted
+    to it with asyncio.run_coroutine_threadsafe, so one loop serves every
+    call instead of a loop being created or fetched per call.
+    
+    Returns:
+        The running background event loop
+    """
+    global _BG_LOOP
+    loop = _BG_LOOP
+    if loop is None:
+        with _BG_LOOP_LOCK:
+            if _BG_LOOP is None:
+                _BG_LOOP = _new_event_loop()
+                threading.Thread(
+                    target=_BG_LOOP.run_forever, name="pge-bridge-loop", daemon=True
+                ).start()
+            loop = _BG_LOOP
+    return loop
 
-def _get_arcium_client():
-    """Lazy import of Arcium bridge client"""
-    global _arcium_client
-    if _arcium_client is None:
-        try:
-            # Import here to avoid requiring arcium-bridge as a hard dependency
-            import sys
-            import os
-            # Add parent directory to path to import from evalys-arcium-bridge-service
-            bridge_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 
-                                      "..", "evalys-arcium-bridge-service", "src")
-            if os.path.exists(bridge_path):
-                sys.path.insert(0, os.path.dirname(bridge_path))
-                from bridge.arcium_client import ArciumBridgeClient
-                from bridge.models import UserPreferences, UserHistory, CurveState
-                _arcium_client = {
-                    "client": ArciumBridgeClient,
-                    "models": {
-                        "UserPreferences": UserPreferences,
-                        "UserHistory": UserHistory,
-                        "CurveState": CurveState,
-                    }
-                }
-        except ImportError:
-            logger.warning("Arcium bridge service not available. Confidential mode will use fallback.")
-            _arcium_client = False
-    return _arcium_client
-
-
-def _get_gmcp_client():
-    """Lazy import of gMPC bridge client"""
-    global _gmcp_client
-    if _gmcp_client is None:
-        try:
-            import sys
-            import os
-            # Add parent directory to path to import from evalys-arcium-gMPC bridge service
-            # Note: This bridge service communicates with the unified evalys-arcium-gmpc-mxe MXE
-            gmcp_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 
-                                     "..", "evalys-arcium-gMPC", "src")
-            if os.path.exists(gmcp_path):
-                sys.path.insert(0, os.path.dirname(gmcp_path))
-                from bridge.gmcp_client import GMPCClient
-                from bridge.models import IntentInput, MarketSnapshot, HistoricalStats
-                _gmcp_client = {
-                    "client": GMPCClient,
-                    "models": {
-                        "IntentInput": IntentInput,
-                        "MarketSnapshot": MarketSnapshot,
-                        "HistoricalStats": HistoricalStats,
-                    }
-                }
-        except ImportError:
-            logger.warning("gMPC bridge service not available. gMPC mode will use fallback.")
-            _gmcp_client = False
-    return _gmcp_client
+
+class _ClientPool:
+    """
+    Pool of bridge clients, used only on the bridge loop
+    
+    Clients are created on demand, up to max_size. When all of them are in
+    use, acquire() waits until one is released.
+    """
+    
+    __slots__ = ("max_size", "size", "_idle")
+    
+    def __init__(self, max_size: int):
+        self.max_size = max(1, max_size)
+        self.size = 0
+        # Created on first use, so it belongs to the bridge loop
+        self._idle: Optional[asyncio.Queue] = None
+    
+    async def acquire(self, factory: Callable[[], Any]) -> Any:
+        """Take an idle client, or create one with factory() if below max_size"""
+        if self._idle is None:
+            self._idle = asyncio.Queue()
+        if self._idle.empty() and self.size < self.max_size:
+            client = factory()
+            self.size += 1
+            return client
+        return await self._idle.get()
+    
+    def release(self, client: Any) -> None:
+        """Return a client taken with acquire()"""
+        self._idle.put_nowait(client)
+    
+    async def aclose(self) -> None:
+        """Close all idle clients"""
+        idle = self._idle
+        while idle is not None and not idle.empty():
+            client = idle.get_nowait()
+            self.size -= 1
+            await client.close()
+
+
+# Predefined level per mode code (see _INT_TO_MODE), indexed directly by the
+# codes select_modes_vec gets back from the selector
+_LEVEL_BY_CODE = tuple(get_privacy_level(mode) for mode in _INT_TO_MODE)
+
+def _log_selected(level: PrivacyLevel) -> None:
+    """Log a rule-based mode selection"""
+    # %-style arguments: only formatted if the record is emitted
+    logger.info(
+        "Privacy mode selected: %s (burners: %s, jitter: %sms, slicing: %s)",
+        level.mode.value,
+        level.burner_count,
+        level.timing_jitter_ms,
+        level.order_slicing,
+    )
+
+
+# Preferences that request a bridge service -> service name (for logs)
+_BRIDGE_PREFERENCES = {"gmcp": "gMPC", "confidential": "Arcium"}
+
+# Context keys read by ModeSelector.adjust_mode_for_context
+_ADJUST_KEYS = frozenset({"risk_level", "sniper_activity"})
 
 
 class PrivacyGradientEngine:
@@ -100,35 +338,68 @@ class PrivacyGradientEngine:
     - Execution Engine: Provides privacy configuration
     
     State:
-        - current_mode: Currently selected PrivacyMode (None if not set)
         - current_level: Current PrivacyLevel configuration (None if not set)
+        - current_mode: Mode of current_level (read-only, None if not set)
         - default_mode: Default mode for initialization
     
     Side effects:
         - Logging (mode selection, adjustments)
-        - State management (current_mode, current_level)
+        - State management (current_level)
     
-    Thread safety: Not thread-safe (single instance per process recommended)
+    Thread safety:
+        State updates are RCU-style: a new PrivacyLevel is fully built before
+        it is published with a single assignment to current_level, and readers
+        load current_level once. Concurrent readers therefore never see a
+        partially updated state and need no lock. Concurrent writers are
+        last-writer-wins.
     """
     
-    def __init__(self, default_mode: PrivacyMode = PrivacyMode.NORMAL):
+    # Fixed attribute set: no per-instance __dict__
+    __slots__ = (
+        "mode_selector",
+        "default_mode",
+        "current_level",
+        "_arcium_pool",
+        "_gmcp_pool",
+        "_config_cache",
+    )
+    
+    def __init__(
+        self,
+        default_mode: PrivacyMode = PrivacyMode.NORMAL,
+        conn_pool_max_size: int = 8,
+    ):
         """
         Initialize Privacy Gradient Engine.
         
         Args:
             default_mode: Default privacy mode to use (PrivacyMode.NORMAL by default)
+            conn_pool_max_size: Maximum number of open clients per bridge service
         
         Side effects:
             - Creates ModeSelector instance
             - Logs initialization
-            - Sets current_mode and current_level to None
+            - Sets current_level to None
         """
         self.mode_selector = ModeSelector()
         self.default_mode = default_mode
-        self.current_mode: Optional[PrivacyMode] = None
         self.current_level: Optional[PrivacyLevel] = None
         
-        logger.info(f"Privacy Gradient Engine initialized with default mode: {default_mode}")
+        # Bridge clients, reused across calls on the shared bridge loop
+        # (see _bg_loop and close())
+        self._arcium_pool = _ClientPool(conn_pool_max_size)
+        self._gmcp_pool = _ClientPool(conn_pool_max_size)
+        
+        # get_privacy_config() result for the level it was built from
+        self._config_cache: Optional[Tuple[PrivacyLevel, Dict[str, Any]]] = None
+        
+        logger.info("Privacy Gradient Engine initialized with default mode: %s", default_mode.value)
+    
+    @property
+    def current_mode(self) -> Optional[PrivacyMode]:
+        """Currently selected PrivacyMode (None if not set)"""
+        level = self.current_level
+        return None if level is None else level.mode
     
     def select_mode(
         self,
@@ -137,9 +408,9 @@ class PrivacyGradientEngine:
         transaction_amount: Optional[float] = None,
         curve_conditions: Optional[Dict[str, Any]] = None,
         enable_arcium: bool = False,
-        arcium_inputs: Optional[Dict[str, Any]] = None,
+        arcium_inputs: Optional[ArciumInputs] = None,
         use_gmcp: bool = False,
-        gmcp_inputs: Optional[Dict[str, Any]] = None,
+        gmcp_inputs: Optional[GmcpInputs] = None,
     ) -> PrivacyLevel:
         """
         Select and configure privacy mode.
@@ -177,7 +448,7 @@ class PrivacyGradientEngine:
             Configured PrivacyLevel with mode, burner_count, timing_jitter_ms, etc.
         
         Side effects:
-            - Updates self.current_mode and self.current_level
+            - Updates self.current_level
             - Logs mode selection
             - May make HTTP requests to Arcium/gMPC bridge services (if enabled)
         
@@ -193,228 +464,398 @@ class PrivacyGradientEngine:
             >>> level.burner_count
             3
         """
-        # If gMPC requested (takes priority for encrypted intent processing)
-        if use_gmcp or user_preference == "gmcp":
-            gmcp_client_info = _get_gmcp_client()
-            if gmcp_client_info and gmcp_inputs:
+        # Requested bridge services, gMPC first; a failure falls through to
+        # the next one and finally to standard mode selection
+        if use_gmcp or enable_arcium or user_preference in _BRIDGE_PREFERENCES:
+            for name, call in self._bridge_calls(
+                user_preference, enable_arcium, arcium_inputs, use_gmcp, gmcp_inputs
+            ):
                 try:
-                    return self._select_mode_with_gmcp_sync(gmcp_inputs, gmcp_client_info)
+                    return self._run_on_loop(call())
                 except Exception as e:
-                    logger.warning(f"gMPC computation failed, falling back to standard mode: {e}")
-                    # Fall through to standard mode selection
+                    logger.warning("%s computation failed, falling back to standard mode: %s", name, e)
+        
+        return self._select_mode_standard(
+            user_preference, risk_level, transaction_amount, curve_conditions
+        )
+    
+    async def select_mode_async(
+        self,
+        user_preference: Optional[str] = None,
+        risk_level: Optional[float] = None,
+        transaction_amount: Optional[float] = None,
+        curve_conditions: Optional[Dict[str, Any]] = None,
+        enable_arcium: bool = False,
+        arcium_inputs: Optional[ArciumInputs] = None,
+        use_gmcp: bool = False,
+        gmcp_inputs: Optional[GmcpInputs] = None,
+    ) -> PrivacyLevel:
+        """
+        Select and configure privacy mode from async code.
+        
+        Same arguments, priority and fallbacks as select_mode. Bridge calls
+        are awaited instead of blocking the caller's thread, so async
+        handlers keep serving other requests while a plan is computed.
+        
+        Returns:
+            Configured PrivacyLevel
         
-        # If confidential mode requested and Arcium is available
-        if enable_arcium or user_preference == "confidential":
-            arcium_client_info = _get_arcium_client()
-            if arcium_client_info and arcium_inputs:
+        Side effects:
+            - Updates self.current_level
+            - Logs mode selection
+            - May make HTTP requests to Arcium/gMPC bridge services (if enabled)
+        """
+        if use_gmcp or enable_arcium or user_preference in _BRIDGE_PREFERENCES:
+            for name, call in self._bridge_calls(
+                user_preference, enable_arcium, arcium_inputs, use_gmcp, gmcp_inputs
+            ):
                 try:
-                    return self._select_mode_with_arcium_sync(arcium_inputs, arcium_client_info)
+                    return await self._await_on_loop(call())
                 except Exception as e:
-                    logger.warning(f"Arcium computation failed, falling back to standard mode: {e}")
-                    # Fall through to standard mode selection
-        
-        # Select mode (standard flow)
-        selected_mode = self.mode_selector.select_mode(
-            user_preference=user_preference,
-            risk_level=risk_level,
-            transaction_amount=transaction_amount,
-            curve_conditions=curve_conditions
+                    logger.warning("%s computation failed, falling back to standard mode: %s", name, e)
+        
+        return self._select_mode_standard(
+            user_preference, risk_level, transaction_amount, curve_conditions
         )
+    
+    def _bridge_calls(
+        self,
+        user_preference: Optional[str],
+        enable_arcium: bool,
+        arcium_inputs: Optional[ArciumInputs],
+        use_gmcp: bool,
+        gmcp_inputs: Optional[GmcpInputs]
+    ) -> List[Tuple[str, Callable[[], Coroutine[Any, Any, PrivacyLevel]]]]:
+        """
+        Bridge selections to try for a select_mode call, in priority order
+        
+        Only bridges that were requested (by flag or preference), are
+        available and got inputs are included.
+        
+        Returns:
+            (service name, call returning the selection coroutine) pairs
+        """
+        calls = []
+        for preference, flag, inputs, info, select in (
+            ("gmcp", use_gmcp, gmcp_inputs, _GMCP, self._select_mode_with_gmcp),
+            ("confidential", enable_arcium, arcium_inputs, _ARCIUM, self._select_mode_with_arcium),
+        ):
+            if (flag or user_preference == preference) and info is not None and inputs:
+                calls.append((_BRIDGE_PREFERENCES[preference], partial(select, inputs, info)))
+        return calls
+    
+    def _select_mode_standard(
+        self,
+        user_preference: Optional[str],
+        risk_level: Optional[float],
+        transaction_amount: Optional[float],
+        curve_conditions: Optional[Dict[str, Any]]
+    ) -> PrivacyLevel:
+        """Rule-based selection shared by select_mode and select_mode_async"""
+        # Select mode (standard flow). A known preference always wins and is
+        # only escalated on high risk, so without a risk level it decides alone.
+        selected_mode = _MODE_BY_VALUE.get(user_preference) if risk_level is None else None
+        if selected_mode is None:
+            selected_mode = self.mode_selector.select_mode(
+                user_preference=user_preference,
+                risk_level=risk_level,
+                transaction_amount=transaction_amount,
+                curve_conditions=curve_conditions
+            )
         
         # Get privacy level configuration
         privacy_level = get_privacy_level(selected_mode)
         
-        # Store current state
-        self.current_mode = selected_mode
+        # Publish new state
         self.current_level = privacy_level
         
-        logger.info(
-            f"Privacy mode selected: {selected_mode.value} "
-            f"(burners: {privacy_level.burner_count}, "
-            f"jitter: {privacy_level.timing_jitter_ms}ms, "
-            f"slicing: {privacy_level.order_slicing})"
-        )
+        _log_selected(privacy_level)
         
         return privacy_level
     
+    def select_modes_vec(
+        self,
+        user_preferences: Sequence[Optional[str]],
+        risk_levels: Sequence[Optional[float]],
+        transaction_amounts: Sequence[Optional[float]],
+        sniper_activities: Sequence[Optional[float]],
+        update_state: bool = False,
+    ) -> List[PrivacyLevel]:
+        """
+        Select privacy levels for a batch of independent requests.
+        
+        The i-th element of each sequence describes the i-th request; all
+        sequences must have the same length. Only the standard rule-based
+        selection is used (no Arcium/gMPC bridge calls).
+        
+        Args:
+            user_preferences: Preferred mode per request (or None)
+            risk_levels: Risk level per request (or None)
+            transaction_amounts: Transaction amount in SOL per request (or None)
+            sniper_activities: Curve sniper activity per request (or None)
+            update_state: If True, publish the last selected level as
+                current_level, as if the requests had been selected one by one
+        
+        Returns:
+            List of PrivacyLevel, one per request, in input order
+        
+        Side effects:
+            - Updates self.current_level (only if update_state=True)
+            - Logs each selection (only if update_state=True)
+        
+        Raises:
+            ValueError: If the input sequences differ in length
+        """
+        count = len(user_preferences)
+        if not (len(risk_levels) == len(transaction_amounts) == len(sniper_activities) == count):
+            raise ValueError("Batch inputs must all have the same length")
+        
+        codes = self.mode_selector.select_modes_vec(
+            user_preferences, risk_levels, transaction_amounts, sniper_activities
+        )
+        return self._levels_for_codes(codes, update_state)
+    
+    def select_modes_for_contexts(
+        self,
+        contexts: Sequence[SelectionContext],
+        update_state: bool = False,
+    ) -> List[PrivacyLevel]:
+        """
+        Select privacy levels for a batch of pre-parsed requests.
+        
+        Same as select_modes_vec, for inputs already parsed into
+        SelectionContext (e.g. by the API, once per request).
+        
+        Args:
+            contexts: Selection inputs per request
+            update_state: If True, publish the last selected level as
+                current_level, as if the requests had been selected one by one
+        
+        Returns:
+            List of PrivacyLevel, one per request, in input order
+        
+        Side effects:
+            - Updates self.current_level (only if update_state=True)
+            - Logs each selection (only if update_state=True)
+        """
+        codes = self.mode_selector.select_modes_for_contexts(contexts)
+        return self._levels_for_codes(codes, update_state)
+    
+    def _levels_for_codes(self, codes: Any, update_state: bool) -> List[PrivacyLevel]:
+        """Map selected mode codes to levels, publishing the last one if update_state"""
+        levels = list(map(_LEVEL_BY_CODE.__getitem__, codes.tolist()))
+        
+        if update_state and levels:
+            self.current_level = levels[-1]
+            # Same record per request as select_mode
+            if logger.isEnabledFor(logging.INFO):
+                for level in levels:
+                    _log_selected(level)
+        
+        return levels
+    
+    async def select_modes_batch(
+        self,
+        arcium_requests: Sequence[ArciumInputs]
+    ) -> List[PrivacyLevel]:
+        """
+        Get Arcium confidential plans for several requests concurrently.
+        
+        All plan requests are in flight at the same time (asyncio.gather on
+        the engine's bridge loop, each on a pooled client), so a batch takes
+        about one bridge round-trip instead of one per request.
+        
+        Args:
+            arcium_requests: Arcium inputs per request (same shape as the
+                arcium_inputs argument of select_mode)
+        
+        Returns:
+            List of PrivacyLevel, one per request, in input order
+        
+        Side effects:
+            - HTTP requests to the Arcium bridge service
+            - Does not change self.current_level
+        
+        Raises:
+            RuntimeError: If the Arcium bridge service is not available
+            Exception: If any bridge call fails
+        """
+        return await self._await_on_loop(self._arcium_levels(arcium_requests))
+    
+    def select_modes_batch_sync(
+        self,
+        arcium_requests: Sequence[ArciumInputs]
+    ) -> List[PrivacyLevel]:
+        """Synchronous wrapper for select_modes_batch"""
+        return self._run_on_loop(self._arcium_levels(arcium_requests))
+    
+    async def _arcium_levels(
+        self,
+        arcium_requests: Sequence[ArciumInputs]
+    ) -> List[PrivacyLevel]:
+        """Build the levels for a batch of Arcium requests (runs on the bridge loop)"""
+        arcium_client_info = _ARCIUM
+        if arcium_client_info is None:
+            raise RuntimeError("Arcium bridge service not available")
+        
+        return list(await asyncio.gather(*(
+            self._arcium_level(arcium_inputs, arcium_client_info)
+            for arcium_inputs in arcium_requests
+        )))
+    
     async def _select_mode_with_arcium(
         self,
-        arcium_inputs: Dict[str, Any],
-        arcium_client_info: Dict[str, Any]
+        arcium_inputs: ArciumInputs,
+        arcium_client_info: ArciumClientInfo
     ) -> PrivacyLevel:
         """
         Select mode using Arcium confidential computation
         
         Args:
             arcium_inputs: Inputs for Arcium computation
-            arcium_client_info: Arcium client and models
+            arcium_client_info: Arcium client and model classes (_ARCIUM)
             
         Returns:
             PrivacyLevel configured from Arcium plan
         """
-        import asyncio
-        
-        client_class = arcium_client_info["client"]
-        models = arcium_client_info["models"]
+        privacy_level = await self._arcium_level(arcium_inputs, arcium_client_info)
+        self.current_level = privacy_level
+        return privacy_level
+    
+    async def _arcium_level(
+        self,
+        arcium_inputs: ArciumInputs,
+        arcium_client_info: ArciumClientInfo
+    ) -> PrivacyLevel:
+        """
+        Get an Arcium confidential plan and build its PrivacyLevel
         
-        client = client_class()
+        Does not change engine state, so several calls can run concurrently.
         
-        # Build input models
-        user_prefs = models["UserPreferences"](**arcium_inputs.get("user_preferences", {}))
-        user_history = models["UserHistory"](**arcium_inputs.get("user_history", {}))
-        curve_state = models["CurveState"](**arcium_inputs.get("curve_state", {}))
+        Args:
+            arcium_inputs: Inputs for Arcium computation
+            arcium_client_info: Arcium client and model classes (_ARCIUM)
+            
+        Returns:
+            PrivacyLevel configured from Arcium plan
+        """
+        # Build input models off the bridge loop (model validation is CPU work)
+        request = await asyncio.to_thread(_build_arcium_request, arcium_inputs, arcium_client_info)
         
-        # Get confidential plan from Arcium
-        plan = await client.get_confidential_plan(
-            user_preferences=user_prefs,
-            user_history=user_history,
-            curve_state=curve_state,
-        )
+        # Get confidential plan from Arcium on a pooled client
+        pool = self._arcium_pool
+        client = await pool.acquire(arcium_client_info.client)
+        try:
+            plan = await client.get_confidential_plan(**request)
+        finally:
+            pool.release(client)
         
         # Map Arcium plan to PrivacyLevel
-        mode_map = {
-            "normal": PrivacyMode.NORMAL,
-            "stealth": PrivacyMode.STEALTH,
-            "max_ghost": PrivacyMode.MAX_GHOST,
-        }
-        
-        selected_mode = mode_map.get(plan.recommended_mode, PrivacyMode.MAX_GHOST)
+        selected_mode = _ARCIUM_MODE_MAP.get(plan.recommended_mode, PrivacyMode.MAX_GHOST)
         base_level = get_privacy_level(selected_mode)
         
-        # Override with Arcium plan values
-        privacy_level = PrivacyLevel(
-            mode=PrivacyMode.CONFIDENTIAL,
-            burner_count=base_level.burner_count,  # Could be adjusted by plan
-            timing_jitter_ms=plan.timing_window_sec * 1000,  # Convert to ms
-            order_slicing=True,
-            fragmentation_level=plan.num_slices,
-            use_mev_protection=True,
-            rotation_frequency=1,
-            use_arcium=True,
-            arcium_plan_id=plan.plan_id,
+        # Override with Arcium plan values (timing converted to ms)
+        privacy_level = PrivacyLevel.from_confidential_plan(
+            base_level, plan.timing_window_sec * 1000, plan.num_slices, plan.plan_id
         )
         
-        await client.close()
-        
-        self.current_mode = PrivacyMode.CONFIDENTIAL
-        self.current_level = privacy_level
-        
         logger.info(
-            f"Privacy mode selected via Arcium: CONFIDENTIAL "
-            f"(plan_id: {plan.plan_id}, risk: {plan.risk_level}, "
-            f"slices: {plan.num_slices}, timing: {plan.timing_window_sec}s)"
+            "Privacy mode selected via Arcium: CONFIDENTIAL "
+            "(plan_id: %s, risk: %s, slices: %s, timing: %ss)",
+            plan.plan_id,
+            plan.risk_level,
+            plan.num_slices,
+            plan.timing_window_sec,
         )
         
         return privacy_level
     
-    def _select_mode_with_arcium_sync(
-        self,
-        arcium_inputs: Dict[str, Any],
-        arcium_client_info: Dict[str, Any]
-    ) -> PrivacyLevel:
-        """Synchronous wrapper for async Arcium call"""
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        return loop.run_until_complete(
-            self._select_mode_with_arcium(arcium_inputs, arcium_client_info)
-        )
-    
     async def _select_mode_with_gmcp(
         self,
-        gmcp_inputs: Dict[str, Any],
-        gmcp_client_info: Dict[str, Any]
+        gmcp_inputs: GmcpInputs,
+        gmcp_client_info: GmcpClientInfo
     ) -> PrivacyLevel:
         """
         Select mode using gMPC encrypted intent processing
         
         Args:
             gmcp_inputs: Inputs for gMPC computation
-            gmcp_client_info: gMPC client and models
+            gmcp_client_info: gMPC client and model classes (_GMCP)
             
         Returns:
             PrivacyLevel configured from gMPC plan
         """
-        import asyncio
-        
-        client_class = gmcp_client_info["client"]
-        models = gmcp_client_info["models"]
-        
-        client = client_class()
-        
-        # Build intent input model
-        IntentInput = models["IntentInput"]
-        MarketSnapshot = models["MarketSnapshot"]
-        HistoricalStats = models["HistoricalStats"]
-        
-        intent = IntentInput(
-            trader_profile_id=gmcp_inputs.get("trader_profile_id", "anon-default"),
-            token_mint=gmcp_inputs.get("token_mint", ""),
-            launchpad=gmcp_inputs.get("launchpad", "pumpfun"),
-            max_size_sol=gmcp_inputs.get("max_size_sol", 1.0),
-            risk_level=gmcp_inputs.get("risk_level", "normal"),
-            privacy_priority=gmcp_inputs.get("privacy_priority", "max_privacy"),
-            market_snapshot=MarketSnapshot(**gmcp_inputs.get("market_snapshot", {})),
-            historical_stats=HistoricalStats(**gmcp_inputs.get("historical_stats", {})),
-        )
+        # Build intent input model off the bridge loop (model validation is CPU work)
+        intent = await asyncio.to_thread(_build_intent, gmcp_inputs, gmcp_client_info)
         
-        # Get confidential plan from gMPC
-        plan = await client.execute_gmpc_strategy(intent)
+        # Get confidential plan from gMPC on a pooled client
+        pool = self._gmcp_pool
+        client = await pool.acquire(gmcp_client_info.client)
+        try:
+            plan = await client.execute_gmpc_strategy(intent)
+        finally:
+            pool.release(client)
         
         # Map gMPC plan to PrivacyLevel
-        mode_map = {
-            "NORMAL": PrivacyMode.NORMAL,
-            "STEALTH": PrivacyMode.STEALTH,
-            "MAX_GHOST": PrivacyMode.MAX_GHOST,
-        }
-        
-        selected_mode = mode_map.get(plan.privacy_mode, PrivacyMode.MAX_GHOST)
+        selected_mode = _GMCP_MODE_MAP.get(plan.privacy_mode, PrivacyMode.MAX_GHOST)
         base_level = get_privacy_level(selected_mode)
         
-        # Override with gMPC plan values
-        privacy_level = PrivacyLevel(
-            mode=PrivacyMode.CONFIDENTIAL,
-            burner_count=base_level.burner_count,
-            timing_jitter_ms=plan.time_window_sec * 1000,  # Convert to ms
-            order_slicing=True,
-            fragmentation_level=plan.slice_count,
-            use_mev_protection=True,
-            rotation_frequency=1,
-            use_arcium=True,
-            arcium_plan_id=plan.plan_id,
+        # Override with gMPC plan values (timing converted to ms)
+        privacy_level = PrivacyLevel.from_confidential_plan(
+            base_level, plan.time_window_sec * 1000, plan.slice_count, plan.plan_id
         )
         
-        await client.close()
-        
-        self.current_mode = PrivacyMode.CONFIDENTIAL
         self.current_level = privacy_level
         
         logger.info(
-            f"Privacy mode selected via gMPC: CONFIDENTIAL "
-            f"(plan_id: {plan.plan_id}, risk: {plan.risk_class}, "
-            f"slices: {plan.slice_count}, timing: {plan.time_window_sec}s)"
+            "Privacy mode selected via gMPC: CONFIDENTIAL "
+            "(plan_id: %s, risk: %s, slices: %s, timing: %ss)",
+            plan.plan_id,
+            plan.risk_class,
+            plan.slice_count,
+            plan.time_window_sec,
         )
         
         return privacy_level
     
-    def _select_mode_with_gmcp_sync(
-        self,
-        gmcp_inputs: Dict[str, Any],
-        gmcp_client_info: Dict[str, Any]
-    ) -> PrivacyLevel:
-        """Synchronous wrapper for async gMPC call"""
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        return loop.run_until_complete(
-            self._select_mode_with_gmcp(gmcp_inputs, gmcp_client_info)
-        )
+    def _run_on_loop(self, coro):
+        """
+        Run a bridge coroutine on the shared background event loop
+        
+        Blocks until the coroutine is done. Works whether or not the caller
+        is already inside a running event loop, and the reused bridge
+        clients always stay on the loop they were created on.
+        
+        Args:
+            coro: Coroutine to run
+        
+        Returns:
+            Result of the coroutine
+        
+        Side effects:
+            - Starts the background loop thread on first use
+        """
+        return asyncio.run_coroutine_threadsafe(coro, _bg_loop()).result()
+    
+    async def _await_on_loop(self, coro):
+        """
+        Await a bridge coroutine running on the shared background event loop
+        
+        Async counterpart of _run_on_loop: the caller's event loop stays
+        free while the coroutine runs.
+        
+        Args:
+            coro: Coroutine to run
+        
+        Returns:
+            Result of the coroutine
+        """
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, _bg_loop()))
+    
+    async def _close_clients(self) -> None:
+        """Close the pooled bridge clients (runs on the bridge loop)"""
+        await self._arcium_pool.aclose()
+        await self._gmcp_pool.aclose()
     
     def get_current_level(self) -> Optional[PrivacyLevel]:
         """
@@ -435,52 +876,90 @@ class PrivacyGradientEngine:
         Returns:
             Adjusted PrivacyLevel
         """
-        if not self.current_mode:
+        current_level = self.current_level
+        if current_level is None:
             # No current mode, select based on context
             return self.select_mode(
                 risk_level=context.get("risk_level"),
                 curve_conditions=context
             )
         
+        # Without an escalation indicator the mode cannot change
+        if not _ADJUST_KEYS & context.keys():
+            return current_level
+        
         # Adjust current mode
+        current_mode = current_level.mode
         adjusted_mode = self.mode_selector.adjust_mode_for_context(
-            self.current_mode,
+            current_mode,
             context
         )
         
-        # If mode changed, update level
-        if adjusted_mode != self.current_mode:
+        # If mode changed, publish the new level
+        if adjusted_mode is not current_mode:
             logger.info(
-                f"Privacy mode adjusted: {self.current_mode.value} -> {adjusted_mode.value}"
+                "Privacy mode adjusted: %s -> %s", current_mode.value, adjusted_mode.value
             )
-            self.current_mode = adjusted_mode
-            self.current_level = get_privacy_level(adjusted_mode)
+            current_level = get_privacy_level(adjusted_mode)
+            self.current_level = current_level
         
-        return self.current_level
+        return current_level
     
     def get_privacy_config(self) -> Dict[str, Any]:
         """
         Get current privacy configuration as dictionary
         
+        The dictionary is built once per published level and cached; each
+        call returns a copy of it, so callers may modify their result.
+        
         Returns:
-            Dictionary with privacy configuration
+            Dictionary with privacy configuration (empty if no mode is set)
         """
-        if not self.current_level:
+        level = self.current_level
+        if level is None:
             return {}
         
-        return {
-            "mode": self.current_level.mode.value,
-            "burner_count": self.current_level.burner_count,
-            "timing_jitter_ms": self.current_level.timing_jitter_ms,
-            "order_slicing": self.current_level.order_slicing,
-            "fragmentation_level": self.current_level.fragmentation_level,
-            "use_mev_protection": self.current_level.use_mev_protection,
-            "rotation_frequency": self.current_level.rotation_frequency,
+        # Cached by level identity: publishing a new level invalidates it
+        cached = self._config_cache
+        if cached is not None and cached[0] is level:
+            return cached[1].copy()
+        
+        config = {
+            "mode": level.mode.value,
+            "burner_count": level.burner_count,
+            "timing_jitter_ms": level.timing_jitter_ms,
+            "order_slicing": level.order_slicing,
+            "fragmentation_level": level.fragmentation_level,
+            "use_mev_protection": level.use_mev_protection,
+            "rotation_frequency": level.rotation_frequency,
         }
+        self._config_cache = (level, config)
+        return config.copy()
     
     def reset(self):
         """Reset to default mode"""
-        self.current_mode = None
         self.current_level = None
         logger.info("Privacy Gradient Engine reset to default")
-
+    
+    async def aclose(self) -> None:
+        """
+        Release bridge resources (async version of close())
+        
+        Side effects:
+            - Closes the pooled Arcium/gMPC clients (new ones are created on
+              the next bridge call); the shared bridge loop keeps running
+        """
+        if self._arcium_pool.size or self._gmcp_pool.size:
+            future = asyncio.run_coroutine_threadsafe(self._close_clients(), _bg_loop())
+            await asyncio.wrap_future(future)
+    
+    def close(self) -> None:
+        """
+        Release bridge resources
+        
+        Side effects:
+            - Closes the pooled Arcium/gMPC clients (new ones are created on
+              the next bridge call); the shared bridge loop keeps running
+        """
+        if self._arcium_pool.size or self._gmcp_pool.size:
+            asyncio.run_coroutine_threadsafe(self._close_clients(), _bg_loop()).result()
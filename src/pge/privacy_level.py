@@ -5,15 +5,22 @@ Defines the three privacy modes and their characteristics.
 
 This module provides:
 - PrivacyMode enum: NORMAL, STEALTH, MAX_GHOST, CONFIDENTIAL
+- Integer mode codes (_INT_TO_MODE / _MODE_TO_INT) for internal use
 - PrivacyLevel dataclass: Configuration for each mode
 - Predefined privacy levels with specific parameters
+- get_privacy_level(mode): the predefined level for a mode
+
+get_privacy_level returns the shared predefined instances (the same object
+on every call, so results can be compared with `is`); levels built from a
+confidential plan are new instances.
 
 See docs/threat-model.md for threat coverage of each mode.
 """
 
 from enum import Enum
 from dataclasses import dataclass
-from typing import Optional
+from types import MappingProxyType
+from typing import Callable, ClassVar, Mapping, Optional
 
 
 class PrivacyMode(str, Enum):
@@ -30,15 +37,38 @@ class PrivacyMode(str, Enum):
     STEALTH = "stealth"
     MAX_GHOST = "max_ghost"
     CONFIDENTIAL = "confidential"  # Arcium-powered confidential mode
+    
+    @classmethod
+    def _missing_(cls, value):
+        """Accept mode strings case-insensitively, like ModeSelector does"""
+        if isinstance(value, str):
+            return cls._value2member_map_.get(value.lower())
+        return None
+
+
+# Integer mode codes used internally by the selection kernels; convert to and
+# from PrivacyMode only at API boundaries.
+_INT_TO_MODE = (
+    PrivacyMode.NORMAL,
+    PrivacyMode.STEALTH,
+    PrivacyMode.MAX_GHOST,
+    PrivacyMode.CONFIDENTIAL,
+)
+_MODE_TO_INT = {mode: code for code, mode in enumerate(_INT_TO_MODE)}
 
+# Value string -> PrivacyMode, a plain dict lookup instead of PrivacyMode(value)
+# (read-only view of the enum's own value map)
+_MODE_BY_VALUE: Mapping[str, PrivacyMode] = MappingProxyType(PrivacyMode._value2member_map_)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class PrivacyLevel:
     """
     Privacy level configuration.
     
     This dataclass defines all parameters for a privacy mode.
-    Instances are validated in __post_init__.
+    Instances are validated in __post_init__ and are frozen, so the
+    predefined levels can be shared by every caller.
     
     Attributes:
         mode: Privacy mode (normal, stealth, max_ghost, confidential)
@@ -80,19 +110,76 @@ class PrivacyLevel:
     use_arcium: bool = False
     arcium_plan_id: Optional[str] = None
     
+    # Validation bounds (class constants, not fields)
+    _MIN_FRAG: ClassVar[int] = 1
+    _MAX_FRAG: ClassVar[int] = 10
+    _MIN_BURNER: ClassVar[int] = 1
+    _MIN_JITTER: ClassVar[int] = 0
+    
     def __post_init__(self):
         """Validate privacy level configuration"""
-        if self.fragmentation_level < 1 or self.fragmentation_level > 10:
-            raise ValueError("fragmentation_level must be between 1 and 10")
+        # One combined test for valid levels; the failing field is only
+        # worked out when it fails
+        if not (
+            self._MIN_FRAG <= self.fragmentation_level <= self._MAX_FRAG
+            and self.burner_count >= self._MIN_BURNER
+            and self.timing_jitter_ms >= self._MIN_JITTER
+        ):
+            raise ValueError(self._validation_error())
+    
+    def _validation_error(self) -> str:
+        """Message for the first invariant this level violates"""
+        if not self._MIN_FRAG <= self.fragmentation_level <= self._MAX_FRAG:
+            return f"fragmentation_level must be between {self._MIN_FRAG} and {self._MAX_FRAG}"
+        if self.burner_count < self._MIN_BURNER:
+            return f"burner_count must be at least {self._MIN_BURNER}"
+        return "timing_jitter_ms must be non-negative"
+    
+    @classmethod
+    def from_confidential_plan(
+        cls,
+        base_level: "PrivacyLevel",
+        timing_ms: int,
+        slices: int,
+        plan_id: Optional[str]
+    ) -> "PrivacyLevel":
+        """
+        Build a CONFIDENTIAL level from an Arcium/gMPC plan.
         
-        if self.burner_count < 1:
-            raise ValueError("burner_count must be at least 1")
+        Plans only set timing, slicing and the plan id; burners come from
+        the plan's base mode and the remaining fields are fixed (order
+        slicing, MEV protection, rotation every transaction, use_arcium).
         
-        if self.timing_jitter_ms < 0:
-            raise ValueError("timing_jitter_ms must be non-negative")
-
-
-# Predefined privacy levels
+        Args:
+            base_level: Predefined level of the plan's recommended mode
+            timing_ms: Timing jitter in milliseconds
+            slices: Fragmentation level (number of order slices)
+            plan_id: Plan ID from the bridge service
+        
+        Returns:
+            Validated PrivacyLevel in CONFIDENTIAL mode
+        
+        Raises:
+            ValueError: If the plan values are out of range
+        """
+        # Positional arguments, in field order
+        return cls(
+            PrivacyMode.CONFIDENTIAL,
+            base_level.burner_count,
+            timing_ms,
+            True,
+            slices,
+            True,
+            1,
+            True,
+            plan_id,
+        )
+
+
+# Predefined privacy levels. Each is a singleton: get_privacy_level and the
+# engine's rule-based selection always return these exact objects, so callers
+# may compare them with `is`. Levels built from Arcium/gMPC plans are new
+# instances and must be compared with ==.
 NORMAL_PRIVACY = PrivacyLevel(
     mode=PrivacyMode.NORMAL,
     burner_count=1,
@@ -136,36 +223,14 @@ CONFIDENTIAL_PRIVACY = PrivacyLevel(
 )
 
 
-def get_privacy_level(mode: PrivacyMode) -> PrivacyLevel:
-    """
-    Get predefined privacy level for a mode.
-    
-    Returns a pre-configured PrivacyLevel instance for the given mode.
-    These are the default configurations used by the orchestrator.
-    
-    Args:
-        mode: Privacy mode (NORMAL, STEALTH, MAX_GHOST, or CONFIDENTIAL)
-    
-    Returns:
-        PrivacyLevel configuration with predefined parameters
-    
-    Side effects: None (pure function)
-    
-    Raises:
-        KeyError: If mode is not in the predefined levels
-    
-    Examples:
-        >>> level = get_privacy_level(PrivacyMode.STEALTH)
-        >>> level.burner_count
-        3
-        >>> level.timing_jitter_ms
-        500
-    """
-    levels = {
-        PrivacyMode.NORMAL: NORMAL_PRIVACY,
-        PrivacyMode.STEALTH: STEALTH_PRIVACY,
-        PrivacyMode.MAX_GHOST: MAX_GHOST_PRIVACY,
-        PrivacyMode.CONFIDENTIAL: CONFIDENTIAL_PRIVACY,
-    }
-    return levels[mode]
+# Predefined level per mode, looked up by get_privacy_level (read-only)
+_LEVELS: Mapping[PrivacyMode, PrivacyLevel] = MappingProxyType({
+    PrivacyMode.NORMAL: NORMAL_PRIVACY,
+    PrivacyMode.STEALTH: STEALTH_PRIVACY,
+    PrivacyMode.MAX_GHOST: MAX_GHOST_PRIVACY,
+    PrivacyMode.CONFIDENTIAL: CONFIDENTIAL_PRIVACY,
+})
+
 
+# Predefined level per mode; bound lookup (no Python frame), raises KeyError
+get_privacy_level: Callable[[PrivacyMode], PrivacyLevel] = _LEVELS.__getitem__
@@ -0,0 +1,124 @@
+"""
+Request batching utilities
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class BatchQueue(Generic[T, R]):
+    """
+    Micro-batcher for concurrent requests
+    
+    Items submitted within wait_ms of the first queued one (up to max_size)
+    are processed together with a single handler call. Batches are handled
+    one at a time, in arrival order, so items that arrive while a batch is
+    being handled are collected into the next one.
+    
+    The handler receives the items of a batch and returns one result per
+    item, in the same order. A result that is an exception instance is
+    raised to that item's submitter only; if the handler itself raises, or
+    returns the wrong number of results, every item of the batch gets an
+    exception.
+    
+    The worker task is started on the running event loop by start() or
+    lazily by the first submit(), and is restarted if submit() is called
+    from a different event loop. stop() fails every item that has not been
+    handled yet with a RuntimeError, so no submitter is left waiting.
+    """
+    
+    def __init__(
+        self,
+        handler: Callable[[List[T]], Awaitable[Sequence[Any]]],
+        max_size: int,
+        wait_ms: float
+    ):
+        self.handler = handler
+        self.max_size = max(1, max_size)
+        self.wait_s = max(0.0, wait_ms) / 1000.0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+    
+    def start(self) -> None:
+        """Start the worker task on the running event loop"""
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._worker = self._loop.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """Stop the worker task and fail the items still queued"""
+        worker, self._worker = self._worker, None
+        if worker is not None:
+            worker.cancel()
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+        
+        queue = self._queue
+        if queue is not None:
+            pending = []
+            while not queue.empty():
+                pending.append(queue.get_nowait())
+            _fail(pending, RuntimeError("Batch queue stopped"))
+    
+    async def submit(self, item: T) -> R:
+        """Queue an item and wait for its result"""
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._loop is not loop:
+            self.start()
+        
+        future = loop.create_future()
+        self._queue.put_nowait((item, future))
+        return await future
+    
+    async def _run(self) -> None:
+        """Worker loop: collect a batch, handle it, resolve the futures"""
+        queue = self._queue
+        batch: List[Tuple[T, asyncio.Future]] = []
+        try:
+            while True:
+                batch = [await queue.get()]
+                if self.wait_s:
+                    # Give concurrent submitters a chance to join this batch
+                    await asyncio.sleep(self.wait_s)
+                while len(batch) < self.max_size and not queue.empty():
+                    batch.append(queue.get_nowait())
+                await self._dispatch(batch)
+        finally:
+            # Stopped while collecting or handling a batch
+            _fail(batch, RuntimeError("Batch queue stopped"))
+    
+    async def _dispatch(self, batch: List[Tuple[T, asyncio.Future]]) -> None:
+        """Handle a batch and resolve each item's future"""
+        try:
+            results = await self.handler([item for item, _ in batch])
+        except Exception as e:
+            _fail(batch, e)
+            return
+        
+        if len(results) != len(batch):
+            _fail(batch, RuntimeError(
+                f"Batch handler returned {len(results)} results for {len(batch)} items"
+            ))
+            return
+        
+        for (_, future), result in zip(batch, results):
+            # Skip items whose submitter has gone away
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+def _fail(batch: Sequence[Tuple[Any, asyncio.Future]], error: Exception) -> None:
+    """Set error on every unresolved future of a batch"""
+    for _, future in batch:
+        if not future.done():
+            future.set_exception(error)
@@ -4,13 +4,25 @@ Logging utilities
 
 import logging
 import sys
-from typing import Optional
+from typing import Optional, Set
+
+# Shared by every handler get_logger installs (the format never changes)
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+# Names of the loggers get_logger has already configured
+_CONFIGURED: Set[str] = set()
 
 
 def get_logger(name: str, level: Optional[int] = None) -> logging.Logger:
     """
     Get logger instance
     
+    The handler and level are set up on the first call for a name; later
+    calls without a level return the logger as is.
+    
     Args:
         name: Logger name (usually __name__)
         level: Logging level (default: INFO)
@@ -19,16 +31,14 @@ def get_logger(name: str, level: Optional[int] = None) -> logging.Logger:
         Configured logger
     """
     logger = logging.getLogger(name)
+    if name in _CONFIGURED and level is None:
+        return logger
     
     if not logger.handlers:
         handler = logging.StreamHandler(sys.stdout)
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        handler.setFormatter(formatter)
+        handler.setFormatter(_FORMATTER)
         logger.addHandler(handler)
     
     logger.setLevel(level or logging.INFO)
+    _CONFIGURED.add(name)
     return logger
-
@@ -0,0 +1,66 @@
+"""
+Tests for request batching utilities
+"""
+
+import asyncio
+from src.utils.batching import BatchQueue
+
+
+def test_batch_queue_coalesces():
+    """Test that concurrent submissions share one handler call"""
+    batches = []
+    
+    async def handler(items):
+        batches.append(list(items))
+        return [item * 2 for item in items]
+    
+    async def run():
+        queue = BatchQueue(handler, max_size=8, wait_ms=1.0)
+        try:
+            return await asyncio.gather(*(queue.submit(i) for i in range(3)))
+        finally:
+            await queue.stop()
+    
+    assert asyncio.run(run()) == [0, 2, 4]
+    assert batches == [[0, 1, 2]]
+
+
+def test_batch_queue_short_results():
+    """Test that a handler returning too few results fails the whole batch"""
+    async def handler(items):
+        return items[:-1]
+    
+    async def run():
+        queue = BatchQueue(handler, max_size=8, wait_ms=1.0)
+        try:
+            return await asyncio.wait_for(
+                asyncio.gather(*(queue.submit(i) for i in range(2)), return_exceptions=True),
+                timeout=1.0
+            )
+        finally:
+            await queue.stop()
+    
+    results = asyncio.run(run())
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_batch_queue_stop_fails_pending():
+    """Test that stop() fails submissions that were not handled yet"""
+    async def run():
+        handling = asyncio.Event()
+        
+        async def handler(items):
+            handling.set()
+            await asyncio.sleep(10)
+            return items
+        
+        queue = BatchQueue(handler, max_size=1, wait_ms=0.0)
+        submissions = [asyncio.ensure_future(queue.submit(i)) for i in range(3)]
+        await handling.wait()
+        await queue.stop()
+        return await asyncio.wait_for(
+            asyncio.gather(*submissions, return_exceptions=True), timeout=1.0
+        )
+    
+    results = asyncio.run(run())
+    assert all(isinstance(result, RuntimeError) for result in results)
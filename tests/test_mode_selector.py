@@ -3,7 +3,7 @@ Tests for mode selector
 """
 
 import pytest
-from src.pge.mode_selector import ModeSelector
+from src.pge.mode_selector import ModeSelector, SelectionContext
 from src.pge.privacy_level import PrivacyMode
 
 
@@ -80,6 +80,24 @@ def test_select_mode_default():
     assert mode == PrivacyMode.NORMAL
 
 
+def test_select_mode_for_context():
+    """Test mode selection from a pre-parsed context"""
+    selector = ModeSelector()
+    
+    # Empty context behaves like no parameters
+    assert selector.select_mode_for_context(SelectionContext()) == PrivacyMode.NORMAL
+    
+    context = SelectionContext.from_inputs(
+        user_preference="Normal",
+        risk_level=0.8,
+        curve_conditions={"sniper_activity": 0.1}
+    )
+    assert context.pref_code == 0
+    assert context.risk == 0.8
+    assert context.amount != context.amount  # NaN: not provided
+    assert selector.select_mode_for_context(context) == PrivacyMode.STEALTH
+
+
 def test_adjust_mode_for_context():
     """Test dynamic mode adjustment"""
     selector = ModeSelector()
@@ -98,3 +116,69 @@ def test_adjust_mode_for_context():
     )
     assert adjusted == PrivacyMode.MAX_GHOST
 
+
+
+def test_select_modes_vec_matches_select_mode():
+    """Test vectorized selection agrees with scalar selection"""
+    import itertools
+    from src.pge.privacy_level import _INT_TO_MODE
+    
+    selector = ModeSelector()
+    
+    prefs = [None, "normal", "Stealth", "max_ghost", "confidential", "gmcp"]
+    risks = [None, 0.0, 0.3, 0.4, 0.5, 0.6, 0.7, 0.75, 0.8, 0.95]
+    amounts = [None, 0.0, 5.0, 10.0, 30.0, 50.0, 80.0]
+    snipers = [None, 0.0, 0.4, 0.5, 0.7, 0.9]
+    
+    cases = list(itertools.product(prefs, risks, amounts, snipers))
+    codes = selector.select_modes_vec(*zip(*cases))
+    
+    for (pref, risk, amount, sniper), code in zip(cases, codes.tolist()):
+        expected = selector.select_mode(
+            user_preference=pref,
+            risk_level=risk,
+            transaction_amount=amount,
+            curve_conditions=None if sniper is None else {"sniper_activity": sniper}
+        )
+        assert _INT_TO_MODE[code] == expected, (pref, risk, amount, sniper)
+    
+    # Pre-parsed contexts select the same modes
+    contexts = [
+        SelectionContext.from_inputs(
+            pref, risk, amount, None if sniper is None else {"sniper_activity": sniper}
+        )
+        for pref, risk, amount, sniper in cases
+    ]
+    assert selector.select_modes_for_contexts(contexts).tolist() == codes.tolist()
+
+
+def test_zero_and_missing_inputs():
+    """Test that 0.0 counts as a provided value and None as missing"""
+    selector = ModeSelector()
+    
+    # Zero risk is a real (low) risk: preference kept, no escalation
+    mode = selector.select_mode(user_preference="normal", risk_level=0.0)
+    assert mode == PrivacyMode.NORMAL
+    
+    # Zero risk does not block lower-priority rules
+    mode = selector.select_mode(risk_level=0.0, curve_conditions={"sniper_activity": 0.8})
+    assert mode == PrivacyMode.MAX_GHOST
+    
+    # Null indicators in the adjustment context are ignored
+    adjusted = selector.adjust_mode_for_context(
+        PrivacyMode.NORMAL,
+        {"risk_level": None, "sniper_activity": 0.7}
+    )
+    assert adjusted == PrivacyMode.STEALTH
+
+
+def test_default_mode_change():
+    """Test that select_mode follows changes of the default mode"""
+    selector = ModeSelector()
+    selector.default_mode = PrivacyMode.MAX_GHOST
+    assert selector.select_mode() == PrivacyMode.MAX_GHOST
+    assert selector.select_mode(risk_level=0.4) == PrivacyMode.NORMAL
+    
+    # select_mode stays a regular method
+    assert "select_mode" in vars(ModeSelector)
+    assert "select_mode" not in vars(selector)
@@ -2,9 +2,14 @@
 Tests for Privacy Gradient Engine orchestrator
 """
 
+import asyncio
+import json
+import sys
+from types import SimpleNamespace
 import pytest
+from src.pge import orchestrator
 from src.pge.orchestrator import PrivacyGradientEngine
-from src.pge.privacy_level import PrivacyMode, PrivacyLevel
+from src.pge.privacy_level import PrivacyMode, PrivacyLevel, STEALTH_PRIVACY
 
 
 def test_engine_initialization():
@@ -21,6 +26,15 @@ def test_engine_initialization_custom_mode():
     assert engine.default_mode == PrivacyMode.STEALTH
 
 
+def test_engine_slots():
+    """Test that engines have fixed attributes (no per-instance __dict__)"""
+    engine = PrivacyGradientEngine()
+    assert not hasattr(engine, "__dict__")
+    
+    with pytest.raises(AttributeError):
+        engine.unknown_attribute = 1
+
+
 def test_select_mode():
     """Test mode selection"""
     engine = PrivacyGradientEngine()
@@ -100,3 +114,274 @@ def test_reset():
     assert engine.current_mode is None
     assert engine.current_level is None
 
+
+
+def test_select_modes_vec():
+    """Test batched mode selection"""
+    engine = PrivacyGradientEngine()
+    
+    levels = engine.select_modes_vec(
+        user_preferences=["max_ghost", None, None, None],
+        risk_levels=[None, 0.9, None, None],
+        transaction_amounts=[None, None, None, 15.0],
+        sniper_activities=[None, None, 0.5, None],
+    )
+    
+    assert [level.mode for level in levels] == [
+        PrivacyMode.MAX_GHOST,
+        PrivacyMode.MAX_GHOST,
+        PrivacyMode.STEALTH,
+        PrivacyMode.STEALTH,
+    ]
+    
+    # Batch selection does not change engine state
+    assert engine.current_mode is None
+    assert engine.current_level is None
+
+
+def test_select_modes_vec_logs_published(caplog):
+    """Test that batches which update engine state log each selection"""
+    engine = PrivacyGradientEngine()
+    
+    with caplog.at_level("INFO", logger=orchestrator.logger.name):
+        engine.select_modes_vec(["stealth", "max_ghost"], [None, None], [None, None], [None, None])
+        assert not [r for r in caplog.records if "Privacy mode selected" in r.getMessage()]
+        
+        engine.select_modes_vec(
+            ["stealth", "max_ghost"], [None, None], [None, None], [None, None], update_state=True
+        )
+    
+    messages = [r.getMessage() for r in caplog.records if "Privacy mode selected" in r.getMessage()]
+    assert [m.split()[3] for m in messages] == ["stealth", "max_ghost"]
+
+
+def test_select_modes_vec_length_mismatch():
+    """Test batched mode selection rejects inputs of different lengths"""
+    engine = PrivacyGradientEngine()
+    
+    with pytest.raises(ValueError):
+        engine.select_modes_vec(["normal"], [None, None], [None], [None])
+
+
+def test_get_privacy_config_cached():
+    """Test that cached configs are plain dicts, independent per call"""
+    engine = PrivacyGradientEngine()
+    assert json.dumps(engine.get_privacy_config()) == "{}"
+    engine.select_mode(user_preference="stealth")
+    
+    config = engine.get_privacy_config()
+    assert type(config) is dict
+    assert json.loads(json.dumps(config)) == config
+    
+    # Modifying a result does not affect later calls
+    config["burner_count"] = 10
+    assert engine.get_privacy_config()["burner_count"] == STEALTH_PRIVACY.burner_count
+    
+    engine.select_mode(user_preference="max_ghost")
+    assert engine.get_privacy_config()["mode"] == "max_ghost"
+    assert config["mode"] == "stealth"
+
+
+class _FakeArciumClient:
+    """Stand-in Arcium bridge client that records concurrent plan requests"""
+    
+    in_flight = 0
+    peak = 0
+    created = 0
+    closed = 0
+    
+    def __init__(self):
+        type(self).created += 1
+    
+    async def get_confidential_plan(self, user_preferences, user_history, curve_state):
+        cls = type(self)
+        cls.in_flight += 1
+        cls.peak = max(cls.peak, cls.in_flight)
+        await asyncio.sleep(0.01)
+        cls.in_flight -= 1
+        return SimpleNamespace(
+            plan_id=user_preferences.plan_id,
+            recommended_mode="stealth",
+            timing_window_sec=2,
+            num_slices=4,
+            risk_level="medium",
+        )
+    
+    async def close(self):
+        type(self).closed += 1
+
+
+@pytest.fixture
+def fake_arcium(monkeypatch):
+    """Install _FakeArciumClient as the Arcium bridge, with fresh counters"""
+    for counter in ("in_flight", "peak", "created", "closed"):
+        monkeypatch.setattr(_FakeArciumClient, counter, 0)
+    monkeypatch.setattr(orchestrator, "_ARCIUM", orchestrator.ArciumClientInfo(
+        _FakeArciumClient, SimpleNamespace, SimpleNamespace, SimpleNamespace
+    ))
+    return _FakeArciumClient
+
+
+def test_select_modes_batch(fake_arcium):
+    """Test concurrent Arcium plan requests"""
+    engine = PrivacyGradientEngine()
+    requests = [{"user_preferences": {"plan_id": f"plan-{i}"}} for i in range(5)]
+    
+    try:
+        levels = engine.select_modes_batch_sync(requests)
+        assert [level.arcium_plan_id for level in levels] == [f"plan-{i}" for i in range(5)]
+        assert all(level.mode == PrivacyMode.CONFIDENTIAL for level in levels)
+        assert levels[0].timing_jitter_ms == 2000
+        
+        # All requests were in flight together
+        assert _FakeArciumClient.peak == 5
+        
+        levels = asyncio.run(engine.select_modes_batch(requests[:2]))
+        assert [level.arcium_plan_id for level in levels] == ["plan-0", "plan-1"]
+        
+        # Batches do not change engine state
+        assert engine.current_level is None
+    finally:
+        engine.close()
+
+
+def test_bridge_client_pool(fake_arcium):
+    """Test that bridge clients are pooled up to conn_pool_max_size"""
+    engine = PrivacyGradientEngine(conn_pool_max_size=2)
+    requests = [{"user_preferences": {"plan_id": f"plan-{i}"}} for i in range(5)]
+    
+    try:
+        engine.select_modes_batch_sync(requests)
+        engine.select_modes_batch_sync(requests)
+        assert _FakeArciumClient.peak == 2
+        assert _FakeArciumClient.created == 2
+    finally:
+        engine.close()
+    assert _FakeArciumClient.closed == 2
+
+
+def test_arcium_requests_overlap(fake_arcium):
+    """Test that an Arcium request does not wait for one already in flight"""
+    engine = PrivacyGradientEngine()
+    
+    async def select(plan_id):
+        return await engine.select_mode_async(
+            enable_arcium=True,
+            arcium_inputs={"user_preferences": {"plan_id": plan_id}},
+        )
+    
+    async def run():
+        first = asyncio.ensure_future(select("plan-0"))
+        while not _FakeArciumClient.in_flight:
+            await asyncio.sleep(0.001)
+        await select("plan-1")
+        await first
+    
+    try:
+        asyncio.run(run())
+        assert _FakeArciumClient.peak == 2
+    finally:
+        engine.close()
+
+
+def test_select_modes_batch_unavailable(monkeypatch):
+    """Test batch selection without the Arcium bridge service"""
+    monkeypatch.setattr(orchestrator, "_ARCIUM", None)
+    engine = PrivacyGradientEngine()
+    
+    try:
+        with pytest.raises(RuntimeError):
+            engine.select_modes_batch_sync([{}])
+    finally:
+        engine.close()
+
+
+def test_select_mode_async(fake_arcium):
+    """Test async mode selection with and without the Arcium bridge"""
+    engine = PrivacyGradientEngine()
+    
+    async def select():
+        confidential = await engine.select_mode_async(
+            enable_arcium=True,
+            arcium_inputs={"user_preferences": {"plan_id": "plan-async"}},
+        )
+        assert confidential.arcium_plan_id == "plan-async"
+        assert engine.current_level is confidential
+        return await engine.select_mode_async(user_preference="stealth")
+    
+    try:
+        level = asyncio.run(select())
+        assert level.mode == PrivacyMode.STEALTH
+        assert engine.current_level is level
+    finally:
+        engine.close()
+
+
+def test_adjust_privacy_level_without_indicators():
+    """Test that a context without risk indicators keeps the current level"""
+    engine = PrivacyGradientEngine()
+    level = engine.select_mode(user_preference="normal")
+    
+    assert engine.adjust_privacy_level({"market_trend": "down"}) is level
+    assert engine.current_level is level
+
+
+class _FailingGmcpClient:
+    """Stand-in gMPC bridge client whose strategy call always fails"""
+    
+    async def execute_gmpc_strategy(self, intent):
+        raise ConnectionError("gMPC bridge unreachable")
+    
+    async def close(self):
+        pass
+
+
+def test_select_mode_bridge_fallback(fake_arcium, monkeypatch):
+    """Test that a failed gMPC call falls back to Arcium, then to the rules"""
+    monkeypatch.setattr(orchestrator, "_GMCP", orchestrator.GmcpClientInfo(
+        _FailingGmcpClient, SimpleNamespace, SimpleNamespace, SimpleNamespace
+    ))
+    engine = PrivacyGradientEngine()
+    
+    try:
+        level = engine.select_mode(
+            use_gmcp=True,
+            gmcp_inputs={"token_mint": "mint"},
+            enable_arcium=True,
+            arcium_inputs={"user_preferences": {"plan_id": "plan-fallback"}},
+        )
+        assert level.arcium_plan_id == "plan-fallback"
+        
+        level = engine.select_mode(user_preference="gmcp", gmcp_inputs={"token_mint": "mint"})
+        assert level.mode == engine.default_mode
+    finally:
+        engine.close()
+
+
+def test_bridge_package_isolated(tmp_path, monkeypatch):
+    """Test that two checkouts' `bridge` packages load side by side"""
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    monkeypatch.setattr(orchestrator, "_PATHS_ADDED", set())
+    checkouts = []
+    for name in ("arcium", "gmcp"):
+        package = tmp_path / name / "bridge"
+        package.mkdir(parents=True)
+        (package / "__init__.py").write_text("")
+        (package / f"{name}_client.py").write_text(f"NAME = {name!r}\n")
+        (package / "models.py").write_text(f"NAME = {name!r}\n")
+        checkouts.append(tmp_path / name)
+    
+    try:
+        with orchestrator._bridge_package(checkouts[0]):
+            from bridge.arcium_client import NAME as arcium_client
+            from bridge.models import NAME as arcium_models
+        with orchestrator._bridge_package(checkouts[1]):
+            from bridge.gmcp_client import NAME as gmcp_client
+            from bridge.models import NAME as gmcp_models
+        
+        assert (arcium_client, arcium_models) == ("arcium", "arcium")
+        assert (gmcp_client, gmcp_models) == ("gmcp", "gmcp")
+        # The first checkout keeps the `bridge` name afterwards
+        assert sys.modules["bridge.models"].NAME == "arcium"
+    finally:
+        orchestrator._pop_bridge_modules()
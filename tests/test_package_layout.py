@@ -0,0 +1,16 @@
+"""
+Tests for the source tree layout
+"""
+
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+
+def test_no_backup_copies():
+    """No backup copies of modules (e.g. mode_selector.py.orig or mode_selector.py~) under src/"""
+    copies = sorted(
+        str(path.relative_to(SRC_DIR)) for path in SRC_DIR.rglob("*.py?*")
+        if "__pycache__" not in path.parts
+    )
+    assert copies == []
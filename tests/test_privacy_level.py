@@ -2,6 +2,9 @@
 Tests for privacy level definitions
 """
 
+import copy
+import dataclasses
+import pickle
 import pytest
 from src.pge.privacy_level import (
     PrivacyMode,
@@ -18,6 +21,11 @@ def test_privacy_mode_enum():
     assert PrivacyMode.NORMAL == "normal"
     assert PrivacyMode.STEALTH == "stealth"
     assert PrivacyMode.MAX_GHOST == "max_ghost"
+    
+    # Lookups by value are case-insensitive
+    assert PrivacyMode("Stealth") is PrivacyMode.STEALTH
+    with pytest.raises(ValueError):
+        PrivacyMode("ghost")
 
 
 def test_privacy_level_creation():
@@ -61,6 +69,19 @@ def test_privacy_level_validation():
         )
 
 
+def test_privacy_level_non_integer_values():
+    """Test that in-range non-integer values are accepted, as before"""
+    level = PrivacyLevel(
+        mode=PrivacyMode.NORMAL,
+        burner_count=1,
+        timing_jitter_ms=100,
+        order_slicing=False,
+        fragmentation_level=3.5,
+        use_mev_protection=False
+    )
+    assert level.fragmentation_level == 3.5
+
+
 def test_predefined_levels():
     """Test predefined privacy levels"""
     assert NORMAL_PRIVACY.mode == PrivacyMode.NORMAL
@@ -87,3 +108,38 @@ def test_get_privacy_level():
     max_ghost = get_privacy_level(PrivacyMode.MAX_GHOST)
     assert max_ghost.mode == PrivacyMode.MAX_GHOST
 
+
+
+def test_get_privacy_level_shared():
+    """Test that predefined levels are shared and cannot be modified"""
+    assert get_privacy_level(PrivacyMode.STEALTH) is STEALTH_PRIVACY
+    
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        STEALTH_PRIVACY.burner_count = 10
+
+
+def test_from_confidential_plan():
+    """Test building a confidential level from a bridge plan"""
+    level = PrivacyLevel.from_confidential_plan(STEALTH_PRIVACY, 3000, 4, "plan-1")
+    
+    assert level.mode == PrivacyMode.CONFIDENTIAL
+    assert level.burner_count == STEALTH_PRIVACY.burner_count
+    assert level.timing_jitter_ms == 3000
+    assert level.fragmentation_level == 4
+    assert level.arcium_plan_id == "plan-1"
+    assert level.order_slicing and level.use_mev_protection and level.use_arcium
+    assert level.rotation_frequency == 1
+    
+    with pytest.raises(ValueError):
+        PrivacyLevel.from_confidential_plan(STEALTH_PRIVACY, 3000, 11, "plan-2")
+
+
+def test_privacy_level_copy_roundtrip():
+    """Test that levels still pickle, copy and convert to dicts"""
+    level = PrivacyLevel.from_confidential_plan(STEALTH_PRIVACY, 3000, 4, "plan-1")
+    for original in (STEALTH_PRIVACY, level):
+        assert pickle.loads(pickle.dumps(original)) == original
+        assert copy.deepcopy(original) == original
+        assert dataclasses.asdict(original)["burner_count"] == original.burner_count
+    
+    assert [f.name for f in dataclasses.fields(PrivacyLevel)][-1] == "arcium_plan_id"
@@ -107,7 +107,8 @@ def test_deterministic_config():
         transaction_amount=20.0
     )
     
-    # Should produce identical configs
+    # Should produce identical configs (the same predefined level)
+    assert level1 is level2
     assert level1.mode == level2.mode
     assert level1.burner_count == level2.burner_count
     assert level1.timing_jitter_ms == level2.timing_jitter_ms
@@ -0,0 +1,28 @@
+"""
+Tests for API routes
+"""
+
+import asyncio
+from fastapi import HTTPException
+from src.api import routes
+from src.api.routes import ModeSelectionRequest
+
+
+def test_select_mode_invalid_request_isolated():
+    """Test that an invalid request does not fail others in its batch"""
+    async def run():
+        try:
+            return await asyncio.gather(
+                routes.select_mode(ModeSelectionRequest(risk_level=0.9)),
+                routes.select_mode(ModeSelectionRequest(curve_conditions={"sniper_activity": "high"})),
+                routes.select_mode(ModeSelectionRequest(risk_level=0.1)),
+                return_exceptions=True
+            )
+        finally:
+            await routes.select_mode_batcher.stop()
+    
+    high, invalid, low = asyncio.run(run())
+    assert high.mode == "max_ghost"
+    assert low.mode == "normal"
+    assert isinstance(invalid, HTTPException)
+    assert invalid.status_code == 500